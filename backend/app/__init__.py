@@ -1,12 +1,45 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.api_router import main_router
+from app.middleware.request_cache import RequestCacheMiddleware
+from app.services.http_client import close_http_client
+from app.services.redis_service import close_redis_client
+from app.services.firestore_service import get_firestore_service
+from app.services.auth_service import blacklist_cleanup_loop
+from app.core.config import settings
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # asyncio.to_thread runs the blocking Firebase/Firestore SDK calls; size the
+    # pool for I/O-bound work rather than the CPU-based default
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=32, thread_name_prefix="blocking-io")
+    )
+    # build the Firestore client pool (credentials, gRPC channels) before serving traffic
+    get_firestore_service()
+    # sweep the in-process token blacklist off the request path (Redis expires its own entries)
+    cleanup_task = None if settings.REDIS_URL else asyncio.create_task(blacklist_cleanup_loop())
+    yield
+    if cleanup_task:
+        cleanup_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await cleanup_task
+    # release pooled outbound connections
+    await close_http_client()
+    await close_redis_client()
 
 app = FastAPI(
     title="RouteRishi API",
     description="An API for fetching travel-related "
     "information like flights, hotels, and more. ",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson serializes response bodies (incl. dates/datetimes) in C
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware to allow frontend requests
@@ -23,6 +56,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-request cache for repeated user/profile lookups
+app.add_middleware(RequestCacheMiddleware)
+
 # main router from the api module
 app.include_router(main_router, prefix="/api")
 
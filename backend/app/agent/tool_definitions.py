@@ -2,7 +2,6 @@ from langchain.tools import StructuredTool
 from pydantic import BaseModel, Field
 from datetime import date, datetime
 from typing import List, Optional, Literal
-import asyncio
 
 from app.services.weather_service import weather_service
 from app.services.currency_service import currency_service
@@ -50,7 +49,7 @@ class CurrencyToolInput(BaseModel):
     target_currency_code: str = Field(description="The three-letter currency code (e.g., 'EUR', 'GBP', 'JPY') to get its exchange rate to USD.")
 
 currency_tool = StructuredTool.from_function(
-    func=currency_service.get_exchange_rate_to_usd,
+    coroutine=currency_service.get_exchange_rate_to_usd,
     name="get_exchange_rate",
     description="Useful for retrieving the exchange rate of a specific currency to US Dollars. "
                 "Input should be a 3-letter currency code like 'EUR' or 'JPY'. "
@@ -61,7 +60,7 @@ currency_tool = StructuredTool.from_function(
 
 # --- Flight Tool ---
 flight_tool = StructuredTool.from_function(
-    func=flight_service.search_flight_offers,
+    coroutine=flight_service.search_flight_offers,
     name="search_flight_offers",
     description="""Useful for finding flight options between two cities.
                 Requires origin and destination IATA codes (e.g., 'JFK', 'CDG'), departure date, and number of adults.
@@ -95,7 +94,7 @@ class HotelToolInput(BaseModel):
     
 
 hotel_tool = StructuredTool.from_function(
-    func=hotel_service.find_hotels_with_offers,
+    coroutine=hotel_service.find_hotels_with_offers,
     name="find_hotels_with_offers",
     description="""Useful for searching for hotels in a specific city and getting detailed offers including prices and room information.
                 Requires a city IATA code, check-in date, check-out date, and number of adult guests.
@@ -121,7 +120,7 @@ class CreateItineraryPDFInput(BaseModel):
     daily_plans: List[dict] = Field(description="Day-by-day activity plans with activities, times, and weather info")
     user_id: Optional[str] = Field(None, description="User ID for saving to profile (optional for guest users)")
 
-def _create_itinerary_pdf_wrapper(**kwargs):
+async def _create_itinerary_pdf_wrapper(**kwargs):
     """Wrapper function for lazy initialization of itinerary service"""
     # Try to get user_id from the travel agent's current user context
     from app.agent.travel_agent import travel_agent
@@ -131,10 +130,11 @@ def _create_itinerary_pdf_wrapper(**kwargs):
         if hasattr(travel_agent, 'current_user_context') and travel_agent.current_user_context:
             kwargs['user_id'] = travel_agent.current_user_context.get('user_id')
     
-    return asyncio.run(get_itinerary_service().create_and_save_complete_itinerary(**kwargs))
+    # awaited on the agent's event loop, where the async Firestore client lives
+    return await get_itinerary_service().create_and_save_complete_itinerary(**kwargs)
 
 create_itinerary_pdf_tool = StructuredTool.from_function(
-    func=_create_itinerary_pdf_wrapper,
+    coroutine=_create_itinerary_pdf_wrapper,
     name="create_itinerary_pdf",
     description="Create a beautiful PDF itinerary document after user confirms their complete travel plan. Use this only after the user has confirmed all flight, hotel, and activity selections and wants to save their complete itinerary. For authenticated users, this will also save the itinerary to their profile.",
     args_schema=CreateItineraryPDFInput,
@@ -57,36 +57,6 @@ class TravelAgent:
             logger.error(f"Failed to initialize TravelAgent: {str(e)}")
             raise
     
-    def run_query(
-        self,
-        user_query: str,
-        conversation_id: str
-    ) -> str:
-        """
-        Runs a user query through the AI agent.
-        (synchronous version for testing)
-        Args:
-            user_query (str): The user's input query.
-            conversation_id (str):  Unique conversation id.
-        Returns:
-            str: The agent's response.
-        """
-        # gets the history for this conversation, or creates a new one if it's the first message.
-        chat_history = self.conversations.setdefault(conversation_id, ChatMessageHistory())
-
-        try:
-            response = self.agent_executor.invoke({"input": user_query,  "chat_history": chat_history.messages})
-            
-            # update the history with the latest exchange.
-            chat_history.add_user_message(user_query)
-            chat_history.add_ai_message(response["output"])
-
-            return response["output"]
-
-        except Exception as e:
-            logger.error(f"\nError in run_query: {str(e)}")
-            return f"I encountered an error while processing your request. Please try rephrasing your question or ask something else."
-    
     async def run_query_async(
         self,
         user_query: str,
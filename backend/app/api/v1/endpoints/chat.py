@@ -139,11 +139,12 @@ async def send_message(
             await firestore_service.create_conversation(new_conversation)
         
         # Create and save user message
+        now = datetime.now(timezone.utc)
         user_message = ChatMessage(
-            id=f"msg_{int(datetime.now(timezone.utc).timestamp() * 1000)}_{request.conversation_id}_user",
+            id=f"msg_{int(now.timestamp() * 1000)}_{request.conversation_id}_user",
             role="user",
             content=request.message.strip(),
-            timestamp=datetime.now(timezone.utc),
+            timestamp=now,
             conversation_id=request.conversation_id
         )
         await firestore_service.add_message(user_message)
@@ -169,11 +170,12 @@ async def send_message(
         )
         
         # Create and save AI message
+        now = datetime.now(timezone.utc)
         ai_message = ChatMessage(
-            id=f"msg_{int(datetime.now(timezone.utc).timestamp() * 1000)}_{request.conversation_id}_ai",
+            id=f"msg_{int(now.timestamp() * 1000)}_{request.conversation_id}_ai",
             role="assistant",
             content=response,
-            timestamp=datetime.now(timezone.utc),
+            timestamp=now,
             conversation_id=request.conversation_id
         )
         await firestore_service.add_message(ai_message)
@@ -271,11 +273,12 @@ async def send_message_with_reasoning(
             await firestore_service.create_conversation(new_conversation)
         
         # Create and save user message
+        now = datetime.now(timezone.utc)
         user_message = ChatMessage(
-            id=f"msg_{int(datetime.now(timezone.utc).timestamp() * 1000)}_{request.conversation_id}_user",
+            id=f"msg_{int(now.timestamp() * 1000)}_{request.conversation_id}_user",
             role="user",
             content=request.message.strip(),
-            timestamp=datetime.now(timezone.utc),
+            timestamp=now,
             conversation_id=request.conversation_id
         )
         await firestore_service.add_message(user_message)
@@ -301,11 +304,12 @@ async def send_message_with_reasoning(
         )
         
         # Create and save AI message with tool calls
+        now = datetime.now(timezone.utc)
         ai_message = ChatMessage(
-            id=f"msg_{int(datetime.now(timezone.utc).timestamp() * 1000)}_{request.conversation_id}_ai",
+            id=f"msg_{int(now.timestamp() * 1000)}_{request.conversation_id}_ai",
             role="assistant",
             content=response_data["response"],
-            timestamp=datetime.now(timezone.utc),
+            timestamp=now,
             conversation_id=request.conversation_id,
             tool_calls=response_data.get("tool_calls"),
             execution_time_ms=response_data.get("total_execution_time_ms")
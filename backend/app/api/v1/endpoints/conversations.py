@@ -1,10 +1,10 @@
 from fastapi import APIRouter, HTTPException, status, Depends, Query
-from app.services.firestore_service import get_firestore_service
+from app.services.firestore_service import get_firestore_service, InvalidCursorError
 from app.middleware.auth_middleware import get_current_user_required
 from app.schemas.auth_schemas import UserResponse
 from app.schemas.conversation_schemas import Conversation, ConversationMetadata
 from app.schemas.chat_schemas import ChatMessage
-from typing import List
+from typing import List, Optional
 import logging
 
 router = APIRouter(prefix="/conversations", tags=["conversations"])
@@ -14,6 +14,7 @@ logger = logging.getLogger(__name__)
 async def get_user_conversations(
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(20, ge=1, le=100, description="Number of conversations per page"),
+    start_after: Optional[str] = Query(None, description="Id of the last conversation of the previous page (cursor pagination, takes precedence over page)"),
     current_user: UserResponse = Depends(get_current_user_required)
 ):
     """
@@ -24,12 +25,19 @@ async def get_user_conversations(
     """
     try:
         firestore_service = get_firestore_service()
-        conversations = await firestore_service.get_user_conversations(
+        # pages are capped at 100, so collect the whole page before responding:
+        # a Firestore error on any document still becomes a 500
+        return [conversation async for conversation in firestore_service.get_user_conversations(
             user_id=current_user.id,
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            start_after=start_after
+        )]
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid start_after cursor"
         )
-        return conversations
     except Exception as e:
         logger.error(f"Error getting conversations for user {current_user.id}: {str(e)}")
         raise HTTPException(
@@ -48,15 +56,9 @@ async def get_conversation(
     try:
         firestore_service = get_firestore_service()
         
-        # Check if user owns the conversation
-        if not await firestore_service.user_owns_conversation(current_user.id, conversation_id):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Conversation not found"
-            )
-        
+        # one read serves both the ownership check and the response
         conversation = await firestore_service.get_conversation(conversation_id)
-        if not conversation:
+        if not firestore_service.is_conversation_owner(conversation, current_user.id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Conversation not found"
@@ -78,6 +80,7 @@ async def get_conversation_messages(
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(50, ge=1, le=100, description="Number of messages per page"),
     order: str = Query("asc", regex="^(asc|desc)$", description="Message order: 'asc' or 'desc'"),
+    start_after: Optional[str] = Query(None, description="Id of the last message of the previous page (cursor pagination, takes precedence over page)"),
     current_user: UserResponse = Depends(get_current_user_required)
 ):
     """
@@ -86,23 +89,27 @@ async def get_conversation_messages(
     try:
         firestore_service = get_firestore_service()
         
-        # Check if user owns the conversation
+        # Verify ownership before reading any messages
         if not await firestore_service.user_owns_conversation(current_user.id, conversation_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Conversation not found"
             )
         
-        messages = await firestore_service.get_messages(
+        return [message async for message in firestore_service.get_messages(
             conversation_id=conversation_id,
             page=page,
             page_size=page_size,
-            order=order
-        )
-        
-        return messages
+            order=order,
+            start_after=start_after
+        )]
     except HTTPException:
         raise
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid start_after cursor"
+        )
     except Exception as e:
         logger.error(f"Error getting messages for conversation {conversation_id}: {str(e)}")
         raise HTTPException(
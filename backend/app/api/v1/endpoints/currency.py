@@ -5,14 +5,14 @@ from app.schemas.currency_schemas import CurrencyRateResponse
 router = APIRouter()
 
 @router.get("/currency/{code}", response_model=CurrencyRateResponse)
-def get_exchange_rate(code: str) -> CurrencyRateResponse:
+async def get_exchange_rate(code: str) -> CurrencyRateResponse:
     """
     Retrieve the exchange rate of a country to USD.
     The 'code' parameter represents the target currency (e.g., 'EUR', 'GBP').
     The response shows how many units of the target currency equal 1 USD.
     Example: If code='EUR' and rate_to_usd=0.92, it means 1 USD = 0.92 EUR.
     """
-    rate = currency_service.get_exchange_rate_to_usd(code)
+    rate = await currency_service.get_exchange_rate_to_usd(code)
 
     if rate is None:
         raise HTTPException(
@@ -7,7 +7,7 @@ from datetime import date
 router = APIRouter()
 
 @router.get("/flights/search", response_model=FlightSearchResponse)
-def get_flights(
+async def get_flights(
     origin_code: str = Query(..., min_length=3, max_length=3, description="IATA code of the origin airport (e.g., 'CVG')."),
     destination_code: str = Query(..., min_length=3, max_length=3, description="IATA code of the destination airport (e.g., 'JFK')."),
     departure_date: date = Query(..., description="Departure date in YYYY-MM-DD format."),
@@ -24,7 +24,7 @@ def get_flights(
     """
     Retrieve flight information based on the provided criteria.
     """
-    flight_offers = flight_service.search_flight_offers(
+    flight_offers = await flight_service.search_flight_offers(
         origin_code=origin_code,
         destination_code=destination_code,
         departure_date=departure_date,
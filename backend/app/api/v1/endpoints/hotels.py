@@ -7,7 +7,7 @@ from typing import Optional, List, Literal
 router = APIRouter()
 
 @router.get("/hotels/search", response_model=List[HotelOffersResponse])
-def get_hotels(
+async def get_hotels(
     city_code: str = Query(..., min_length=3, max_length=3, description="IATA code of the destination city (e.g., 'PAR')."),
     check_in_date: date = Query(..., description="Check-in date of the stay in YYYY-MM-DD format."),
     check_out_date: date = Query(..., description="Check-out date in YYYY-MM-DD format."),
@@ -26,7 +26,7 @@ def get_hotels(
     """
     Searches for hotels in a specified city and retrieves their detailed offers (prices, rooms).
     """
-    hotel_offers = hotel_service.find_hotel_with_offers(
+    hotel_offers = await hotel_service.find_hotels_with_offers(
         city_code=city_code,
         check_in_date=check_in_date,
         check_out_date=check_out_date,
@@ -1,4 +1,5 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import Optional
 import os
 
 class Settings(BaseSettings):
@@ -25,5 +26,8 @@ class Settings(BaseSettings):
     GOOGLE_CLIENT_SECRET: str
     GOOGLE_REDIRECT_URI: str = "http://localhost:8000/api/v1/auth/google/callback"
     FRONTEND_URL: str = "http://localhost:5173"
+
+    # shared state (token blacklist, caches) across workers; in-process when unset
+    REDIS_URL: Optional[str] = None
     
 settings = Settings()
\ No newline at end of file
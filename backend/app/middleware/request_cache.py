@@ -0,0 +1,23 @@
+from contextvars import ContextVar
+from typing import Optional, Dict, Any
+
+# Per-request memo of lookups (e.g. uid -> (firebase_user, user_profile)).
+# None outside of a request, so callers fall back to uncached reads.
+request_cache: ContextVar[Optional[Dict[Any, Any]]] = ContextVar("request_cache", default=None)
+
+class RequestCacheMiddleware:
+    """ASGI middleware giving every HTTP request a fresh lookup cache"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = request_cache.set({})
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_cache.reset(token)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 
 class LoginRequest(BaseModel):
     email: EmailStr
@@ -10,6 +10,9 @@ class SignupRequest(BaseModel):
     password: str
 
 class UserResponse(BaseModel):
+    # frozen: instances are memoized and shared between requests
+    model_config = ConfigDict(frozen=True)
+
     id: str
     email: str
     fullName: str
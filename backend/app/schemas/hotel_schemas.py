@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, AliasPath, BaseModel, ConfigDict, Field, model_validator
+from dataclasses import dataclass
 from datetime import date, datetime
-from typing import Optional, List, Literal
+from typing import Annotated, Any, Optional, List, Literal
 
 class HotelOffersSearchRequest(BaseModel):
     """
@@ -29,11 +30,17 @@ class HotelSearchByCityRequest(BaseModel):
     
 
 # --- Schemas for HotelListResponse (from hotels/by-city) ---
-class GeoCode(BaseModel):
+# Response models validate straight from Amadeus' camelCase payloads through
+# validation-only aliases, so the API still serializes the snake_case names.
+# Small leaf schemas are plain slotted, frozen dataclasses; pydantic still
+# validates and serializes them as part of the enclosing models.
+@dataclass(slots=True, frozen=True)
+class GeoCode:
     latitude: float
     longitude: float
 
-class Distance(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Distance:
     value: float
     unit: str
 
@@ -41,14 +48,20 @@ class CityHotelInfo(BaseModel):
     """
     Essential information for a single hotel found by city search.
     """
-    hotel_id: str = Field(..., description="Unique 8-character Amadeus hotel ID.")
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
+    hotel_id: str = Field(..., validation_alias="hotelId", description="Unique 8-character Amadeus hotel ID.")
     name: str = Field(..., description="Name of the hotel.")
-    chain_code: Optional[str] = Field(None, description="Hotel chain code (e.g., 'MC' for Marriott).")
-    iata_code: Optional[str] = Field(None, description="IATA city code the hotel is located in.")
-    geo_code: Optional[GeoCode] = Field(None, description="Geographical coordinates of the hotel.")
+    chain_code: Optional[str] = Field(None, validation_alias="chainCode", description="Hotel chain code (e.g., 'MC' for Marriott).")
+    iata_code: Optional[str] = Field(None, validation_alias="iataCode", description="IATA city code the hotel is located in.")
+    geo_code: Optional[GeoCode] = Field(None, validation_alias="geoCode", description="Geographical coordinates of the hotel.")
     # Address field from Amadeus often includes just countryCode in this response.
     # If more is needed, it must be extracted or filled from Hotel Offers API.
-    country_code: Optional[str] = Field(None, description="Country code of the hotel's address.")
+    country_code: Optional[str] = Field(
+        None,
+        validation_alias=AliasChoices("country_code", AliasPath("address", "countryCode")),
+        description="Country code of the hotel's address."
+    )
     distance: Optional[Distance] = Field(None, description="Distance from the searched city point.")
 
 class HotelListResponse(BaseModel):
@@ -60,73 +73,106 @@ class HotelListResponse(BaseModel):
 
 # --- Schemas for HotelOffersResponse (from hotel-offers) ---
 
-class RoomTypeEstimated(BaseModel):
+@dataclass(slots=True, frozen=True)
+class RoomTypeEstimated:
     """
     Estimated room type details.
     """
-    category: Optional[str] = Field(None, description="e.g., 'EXECUTIVE_ROOM', 'STANDARD_ROOM'.")
-    beds: Optional[int] = Field(None, description="Number of beds in the room.")
-    bed_type: Optional[str] = Field(None, description="Type of bed, e.g., 'KING', 'DOUBLE'.")
+    category: Annotated[Optional[str], Field(description="e.g., 'EXECUTIVE_ROOM', 'STANDARD_ROOM'.")] = None
+    beds: Annotated[Optional[int], Field(description="Number of beds in the room.")] = None
+    bed_type: Annotated[Optional[str], Field(
+        validation_alias=AliasChoices("bedType", "bed_type"), description="Type of bed, e.g., 'KING', 'DOUBLE'."
+    )] = None
 
-class RoomDescription(BaseModel):
+@dataclass(slots=True, frozen=True)
+class RoomDescription:
     """
     Description of the room.
     """
-    text: Optional[str] = Field(None, description="Full description of the room.")
-    lang: Optional[str] = Field(None, description="Language of the description (e.g., 'EN').")
+    text: Annotated[Optional[str], Field(description="Full description of the room.")] = None
+    lang: Annotated[Optional[str], Field(description="Language of the description (e.g., 'EN').")] = None
 
 class RoomInfo(BaseModel):
     """
     Combined room details within an offer.
     """
+    model_config = ConfigDict(populate_by_name=True)
+
     type: Optional[str] = Field(None, description="Internal room type code.")
-    type_estimated: Optional[RoomTypeEstimated] = Field(None, description="Estimated room category and bed details.")
+    type_estimated: Optional[RoomTypeEstimated] = Field(None, validation_alias="typeEstimated", description="Estimated room category and bed details.")
     description: Optional[RoomDescription] = Field(None, description="Detailed room description.")
 
-class GuestInfo(BaseModel):
+@dataclass(slots=True, frozen=True)
+class GuestInfo:
     """
     Guest details for the offer.
     """
-    adults: int = Field(..., description="Number of adults included in the offer.")
+    adults: Annotated[int, Field(description="Number of adults included in the offer.")]
 
-class OfferPrice(BaseModel):
+@dataclass(slots=True, frozen=True)
+class OfferPrice:
     """
     Price details for a specific hotel offer.
     """
-    currency: str = Field(..., description="Currency of the total price (e.g., 'GBP', 'USD').")
-    total: float = Field(..., description="Total price for the offer.")
-    base: Optional[float] = Field(None, description="Base price before taxes/fees.")
+    currency: Annotated[str, Field(description="Currency of the total price (e.g., 'GBP', 'USD').")]
+    total: Annotated[float, Field(description="Total price for the offer.")]
+    base: Annotated[Optional[float], Field(description="Base price before taxes/fees.")] = None
 
 class CancellationPolicy(BaseModel):
     """
     Cancellation policy details.
     """
     type: Optional[str] = Field(None, description="Type of cancellation, e.g., 'FULL_STAY'.")
-    description_text: Optional[str] = Field(None, alias="description.text", description="Description of the cancellation policy.") # Uses alias to flatten nested key
+    description_text: Optional[str] = Field(None, description="Description of the cancellation policy.")
+
+    @model_validator(mode="before")
+    @classmethod
+    def _flatten_description(cls, data: Any) -> Any:
+        """Flatten Amadeus' nested `description.text` in a single pass"""
+        if isinstance(data, dict) and "description" in data and "description_text" not in data:
+            data = {**data, "description_text": (data["description"] or {}).get("text")}
+        return data
 
 class HotelOfferDetails(BaseModel):
     """
     Schema for a single detailed hotel offer (from /hotel-offers).
     """
-    offer_id: str = Field(..., description="Unique identifier for this specific offer.")
-    check_in_date: date = Field(..., description="Check-in date for this offer.")
-    check_out_date: date = Field(..., description="Check-out date for this offer.")
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
+    offer_id: str = Field(..., validation_alias="id", description="Unique identifier for this specific offer.")
+    check_in_date: date = Field(..., validation_alias="checkInDate", description="Check-in date for this offer.")
+    check_out_date: date = Field(..., validation_alias="checkOutDate", description="Check-out date for this offer.")
     guests: GuestInfo = Field(..., description="Guest details for the offer.")
     price: OfferPrice = Field(..., description="Price details for the hotel offer.")
     room: Optional[RoomInfo] = Field(None, description="Details about the specific room type offered.")
     available: Optional[bool] = Field(None, description="True if the offer is currently available.")
-    payment_type: Optional[str] = Field(None, alias="policies.paymentType", description="Type of payment policy (e.g., 'deposit', 'guarantee').") # Uses alias to flatten nested key
-    cancellation_policy: Optional[CancellationPolicy] = Field(None, alias="policies.cancellation", description="Details of the cancellation policy.") # Uses alias to flatten nested key
+    payment_type: Optional[str] = Field(None, description="Type of payment policy (e.g., 'deposit', 'guarantee').")
+    cancellation_policy: Optional[CancellationPolicy] = Field(None, description="Details of the cancellation policy.")
+
+    @model_validator(mode="before")
+    @classmethod
+    def _flatten_policies(cls, data: Any) -> Any:
+        """Flatten Amadeus' nested `policies` object in a single pass"""
+        if isinstance(data, dict) and "policies" in data:
+            policies = data["policies"] or {}
+            data = {
+                **data,
+                "payment_type": data.get("payment_type", policies.get("paymentType")),
+                "cancellation_policy": data.get("cancellation_policy", policies.get("cancellation")),
+            }
+        return data
 
 class DetailedHotelInfo(BaseModel):
     """
     Information about the hotel associated with the detailed offers.
     This comes directly nested in the /hotel-offers response.
     """
-    hotel_id: str = Field(..., description="Unique 8-character Amadeus hotel ID.")
+    model_config = ConfigDict(populate_by_name=True)
+
+    hotel_id: str = Field(..., validation_alias="hotelId", description="Unique 8-character Amadeus hotel ID.")
     name: str = Field(..., description="Name of the hotel.")
-    chain_code: Optional[str] = None
-    city_code: Optional[str] = None
+    chain_code: Optional[str] = Field(None, validation_alias="chainCode")
+    city_code: Optional[str] = Field(None, validation_alias="cityCode")
     latitude: Optional[float] = None
     longitude: Optional[float] = None
 
@@ -135,4 +181,4 @@ class HotelOffersResponse(BaseModel):
     Overall response for detailed hotel offers for a specific hotel (or hotels).
     """
     hotel: DetailedHotelInfo = Field(..., description="Information about the hotel for which offers are returned.")
-    offers: List[HotelOfferDetails] = Field(..., description="List of detailed offers for the hotel.")
+    offers: List[HotelOfferDetails] = Field(default_factory=list, description="List of detailed offers for the hotel.")
@@ -1,31 +1,37 @@
 # app/schemas/weather_schemas.py
 from pydantic import BaseModel, Field
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Annotated, Literal, Optional
 
 # --- Sub-schemas for WeatherForecastResponse ---
+# Leaf schemas are slotted, frozen dataclasses: cheaper to build than BaseModel and
+# still validated/serialized by pydantic when nested in a response model. Calling them
+# directly does not validate, so weather_service builds them through a TypeAdapter.
 
-class WeatherSignals(BaseModel):
+@dataclass(slots=True, frozen=True)
+class WeatherSignals:
     """
     Qualitative labels for various weather conditions.
     """
-    temp_avg: Literal["cold", "cool", "warm", "hot"] = Field(..., description="Average temperature category.")
-    rain_chance: Literal["none", "low", "moderate", "high"] = Field(..., description="Rainfall amount category.")
-    wind_speed: Literal["calm", "breezy", "strong"] = Field(..., description="Wind speed category.")
-    uv_index: Literal["low", "moderate", "high", "very_high"] = Field(..., description="UV Index category.")
-    humidity: Literal["dry", "moderate", "humid"] = Field(..., description="Humidity category.")
-    cloud_cover: Literal["clear", "partly_cloudy", "cloudy", "overcast"] = Field(..., description="Cloud cover category.")
+    temp_avg: Annotated[Literal["cold", "cool", "warm", "hot", "unavailable"], Field(description="Average temperature category.")]
+    rain_chance: Annotated[Literal["none", "low", "moderate", "high", "unavailable"], Field(description="Rainfall amount category.")]
+    wind_speed: Annotated[Literal["calm", "breezy", "strong", "unavailable"], Field(description="Wind speed category.")]
+    uv_index: Annotated[Literal["low", "moderate", "high", "very_high", "unavailable"], Field(description="UV Index category.")]
+    humidity: Annotated[Literal["dry", "moderate", "humid", "unavailable"], Field(description="Humidity category.")]
+    cloud_cover: Annotated[Literal["clear", "partly_cloudy", "cloudy", "overcast", "unavailable"], Field(description="Cloud cover category.")]
 
-class RawWeatherValues(BaseModel):
+@dataclass(slots=True, frozen=True)
+class RawWeatherValues:
     """
     Raw numerical values for various weather metrics.
     """
-    temp_avg_c: Optional[float] = Field(None, description="Average temperature in Celsius.")
-    rain_mm: Optional[float] = Field(None, description="Total precipitation in millimeters.")
-    wind_kph: Optional[float] = Field(None, description="Average wind speed in kilometers per hour.")
-    uv_index: Optional[float] = Field(None, description="Average UV Index.")
-    humidity: Optional[float] = Field(None, description="Average humidity percentage.")
-    cloud_cover: Optional[float] = Field(None, description="Average cloud cover percentage.")
+    temp_avg_c: Annotated[Optional[float], Field(description="Average temperature in Celsius.")] = None
+    rain_mm: Annotated[Optional[float], Field(description="Total precipitation in millimeters.")] = None
+    wind_kph: Annotated[Optional[float], Field(description="Average wind speed in kilometers per hour.")] = None
+    uv_index: Annotated[Optional[float], Field(description="Average UV Index.")] = None
+    humidity: Annotated[Optional[float], Field(description="Average humidity percentage.")] = None
+    cloud_cover: Annotated[Optional[float], Field(description="Average cloud cover percentage.")] = None
 
 # --- Main Weather Forecast Response Schema ---
 
@@ -0,0 +1,74 @@
+import asyncio
+import functools
+import hashlib
+import logging
+import time
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+import redis
+from cachetools import TLRUCache
+from app.services.redis_service import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Process-wide tokens per API key, each expiring when Amadeus says it should be refreshed
+# (value is (token, monotonic expiry)). Only touched from the event loop thread.
+_local_tokens: TLRUCache = TLRUCache(maxsize=4, ttu=lambda _key, value, _now: value[1], timer=time.monotonic)
+
+# One token refresh per API key at a time, shared by the flight and hotel services
+_refresh_locks: Dict[str, asyncio.Lock] = {}
+
+def _token_key(api_key: str) -> str:
+    """Redis key for an API key's token; flights and hotels share the same credentials, so one key"""
+    digest = hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()
+    return f"amadeus:access_token:{digest}"
+
+def get_cached_token(api_key: str) -> Optional[str]:
+    """Token this process already holds for the API key, or None once it is due for refresh"""
+    cached = _local_tokens.get(api_key)
+    return cached[0] if cached else None
+
+def cache_token(api_key: str, token: str, ttl_seconds: int) -> None:
+    """Keep a token in this process for ttl_seconds"""
+    if ttl_seconds > 0:
+        _local_tokens[api_key] = (token, time.monotonic() + ttl_seconds)
+
+@functools.lru_cache(maxsize=4)
+def bearer_headers(access_token: str) -> Mapping[str, str]:
+    """Read-only Authorization header for a token, built once per token rather than per request"""
+    return MappingProxyType({'Authorization': f'Bearer {access_token}'})
+
+def refresh_lock(api_key: str) -> asyncio.Lock:
+    """Lock every Amadeus client in this process holds while refreshing the API key's token"""
+    lock = _refresh_locks.get(api_key)
+    if lock is None:
+        lock = _refresh_locks[api_key] = asyncio.Lock()
+    return lock
+
+async def load_shared_token(api_key: str) -> Optional[Tuple[str, int]]:
+    """
+    Access token another worker already fetched and its remaining lifetime in seconds,
+    or None on a miss, without REDIS_URL, or when Redis is unreachable.
+    """
+    client = get_redis_client()
+    if client is None:
+        return None
+    key = _token_key(api_key)
+    try:
+        async with client.pipeline() as pipe:
+            token, ttl = await pipe.get(key).ttl(key).execute()
+        if token and ttl > 0:
+            return token.decode(), ttl
+    except redis.RedisError as e:
+        logger.warning(f"Could not read shared Amadeus token: {str(e)}")
+    return None
+
+async def store_shared_token(api_key: str, token: str, ttl_seconds: int) -> None:
+    """Publish a freshly fetched token to the other workers until it is due for refresh"""
+    client = get_redis_client()
+    if client is None or ttl_seconds <= 0:
+        return
+    try:
+        await client.setex(_token_key(api_key), ttl_seconds, token)
+    except redis.RedisError as e:
+        logger.warning(f"Could not store shared Amadeus token: {str(e)}")
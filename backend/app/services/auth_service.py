@@ -1,14 +1,27 @@
+import asyncio
+import functools
 import logging
-from datetime import datetime, timezone
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
 from fastapi import HTTPException, status, Request
-from typing import Optional, Dict, Any, Set
+from typing import Optional, Dict, Any, Set, List, Tuple
 import urllib.parse
 import secrets
+import hashlib
+import heapq
+import time
 import httpx
+import orjson
+from async_timeout import timeout
+from cachetools import TTLCache
+from firebase_admin import firestore
 
 from app.services.firebase_service import FirebaseService
 from app.services.firebase_client_service import firebase_client_service
 from app.services.jwt_service import JWTService
+from app.services.redis_service import get_redis_client
+from app.services.http_client import get_http_client
+from app.middleware.request_cache import request_cache
 from app.schemas.auth_schemas import (
     SignupRequest,
     LoginRequest,
@@ -20,8 +33,61 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
-# Module-level OAuth state storage
-_oauth_states: Dict[str, Dict[str, Any]] = {}
+@dataclass(slots=True)
+class OAuthState:
+    """Pending Google OAuth flow, keyed by its state parameter"""
+    flow_type: str
+    timestamp: float
+    ip: str
+
+# Module-level OAuth state storage, used when Redis is not configured
+_OAUTH_STATE_TTL_SECONDS = 600
+# (insertion order == age, so expired states are always at the front)
+_oauth_states: "OrderedDict[str, OAuthState]" = OrderedDict()
+
+# Module-level token blacklist for logout, used when Redis is not configured:
+# token hashes plus a min-heap of (exp, hash) so expired entries can be
+# dropped without re-decoding tokens
+_blacklisted_hashes: Set[bytes] = set()
+_blacklist_heap: List[Tuple[float, bytes]] = []
+_BLACKLIST_CLEANUP_INTERVAL_SECONDS = 60
+
+# Short-lived cache of verified access tokens: token hash -> (UserResponse, expires_at)
+_TOKEN_CACHE_TTL_SECONDS = 30
+_token_cache: TTLCache = TTLCache(maxsize=10000, ttl=_TOKEN_CACHE_TTL_SECONDS)
+
+# Google OAuth configuration
+_GOOGLE_OAUTH_CONFIG = {
+    "client_id": settings.GOOGLE_CLIENT_ID,
+    "client_secret": settings.GOOGLE_CLIENT_SECRET,
+    "redirect_uri": settings.GOOGLE_REDIRECT_URI,
+    "scope": "openid email profile",
+    "auth_url": "https://accounts.google.com/o/oauth2/auth",
+    "token_url": "https://oauth2.googleapis.com/token",
+    "userinfo_url": "https://www.googleapis.com/oauth2/v2/userinfo"
+}
+
+# Overall deadline for each call to Google's token/userinfo endpoints
+_GOOGLE_OAUTH_TIMEOUT_SECONDS = 5
+
+# Everything in the authorization URL except the state is fixed, so encode it once
+_GOOGLE_OAUTH_URL_PREFIX = f"{_GOOGLE_OAUTH_CONFIG['auth_url']}?" + urllib.parse.urlencode({
+    "client_id": _GOOGLE_OAUTH_CONFIG["client_id"],
+    "redirect_uri": _GOOGLE_OAUTH_CONFIG["redirect_uri"],
+    "scope": _GOOGLE_OAUTH_CONFIG["scope"],
+    "response_type": "code",
+    "access_type": "offline",
+    "prompt": "consent"
+}) + "&state="
+
+# Strong references to fire-and-forget tasks so they are not garbage collected
+_background_tasks: Set[asyncio.Task] = set()
+
+@functools.lru_cache(maxsize=4096)
+def _build_user_response(uid: str, email: str, full_name: str, provider: str) -> UserResponse:
+    """Build the (frozen) UserResponse for a set of user fields, memoized by those fields"""
+    # Fields come from Firebase Auth / Firestore, so validation is skipped
+    return UserResponse.model_construct(id=uid, email=email, fullName=full_name, provider=provider)
 
 class AuthService:
     """Authentication service handling user signup, login, token management"""
@@ -30,19 +96,11 @@ class AuthService:
         self.firebase = firebase_service
         self.firebase_client = firebase_client_service
         self.jwt = jwt_service
-        # Simple in-memory token blacklist for logout
-        self._blacklisted_tokens: Set[str] = set()
+        # Shared blacklist store; None falls back to the module-level blacklist
+        self.redis = get_redis_client()
         
         # Google OAuth configuration
-        self.google_oauth_config = {
-            "client_id": settings.GOOGLE_CLIENT_ID,
-            "client_secret": settings.GOOGLE_CLIENT_SECRET,
-            "redirect_uri": settings.GOOGLE_REDIRECT_URI,
-            "scope": "openid email profile",
-            "auth_url": "https://accounts.google.com/o/oauth2/auth",
-            "token_url": "https://oauth2.googleapis.com/token",
-            "userinfo_url": "https://www.googleapis.com/oauth2/v2/userinfo"
-        }
+        self.google_oauth_config = _GOOGLE_OAUTH_CONFIG
         
 
     
@@ -86,7 +144,7 @@ class AuthService:
             user_response = self._create_user_response(user_profile, firebase_user)
 
             logger.info(f"User successfully created for: {signup_data.email}")
-            return AuthResponse(
+            return AuthResponse.model_construct(
                 user=user_response,
                 token=tokens['access_token'],
                 refreshToken=tokens['refresh_token']
@@ -132,7 +190,11 @@ class AuthService:
                     detail="Invalid email or password"
                 )
             
-            user_profile = await self.firebase.get_user_profile(firebase_user['uid'])
+            # profile read and token signing are independent
+            user_profile, tokens = await asyncio.gather(
+                self.firebase.get_user_profile(firebase_user['uid']),
+                self._generate_token_pair(firebase_user['uid'])
+            )
 
             if not user_profile:
                 # creating profile if it doesn't exist
@@ -142,15 +204,14 @@ class AuthService:
                     full_name=firebase_user.get('display_name', ''),
                     provider='email'
                 )
-            #update last login
-            await self._update_last_login(firebase_user['uid'])
+            # update last login in the background, off the response path
+            self._schedule_last_login_update(firebase_user['uid'])
 
-            tokens = await self._generate_token_pair(firebase_user['uid'])
             user_response = self._create_user_response(user_profile, firebase_user)
             
             logger.info(f"User successfully logged in: {login_data.email}")
             
-            return AuthResponse(
+            return AuthResponse.model_construct(
                 user=user_response,
                 token=tokens['access_token'],
                 refreshToken=tokens['refresh_token']
@@ -194,8 +255,7 @@ class AuthService:
                     detail="Invalid token data"
                 )
             
-            firebase_user = await self.firebase.get_user_by_uid(user_id)
-            user_profile = await self.firebase.get_user_profile(user_id)
+            firebase_user, user_profile = await self._get_user_and_profile(user_id)
 
             if not firebase_user or not user_profile:
                 raise HTTPException(
@@ -208,7 +268,7 @@ class AuthService:
 
             logger.info(f"Token refreshed for user: {user_id}")
             
-            return AuthResponse(
+            return AuthResponse.model_construct(
                 user=user_response,
                 token=tokens['access_token'],
                 refreshToken=tokens['refresh_token']
@@ -237,8 +297,13 @@ class AuthService:
         try:
             # Add token to blacklist if provided
             if access_token:
-                self._blacklisted_tokens.add(access_token)
-                logger.info(f"Token blacklisted for user: {user_id}")
+                # Decode once to learn when the blacklist entry can be dropped
+                payload = self.jwt.verify_token(access_token)
+                if payload:
+                    token_hash = self._hash_token(access_token)
+                    _token_cache.pop(token_hash, None)
+                    await self._blacklist_token(token_hash, payload.get('exp', 0))
+                    logger.info(f"Token blacklisted for user: {user_id}")
             
             logger.info(f"User logged out: {user_id}")
             return True
@@ -257,14 +322,16 @@ class AuthService:
             UserResponse: User information or None if invalid
         """
         try:
-            # Periodically clean up expired tokens (every ~100 calls)
-            if len(self._blacklisted_tokens) > 0 and len(self._blacklisted_tokens) % 100 == 0:
-                self._cleanup_expired_tokens()
+            token_hash = self._hash_token(access_token)
+            now = time.time()
             
-            # Check if token is blacklisted (logged out)
-            if access_token in self._blacklisted_tokens:
-                logger.info("Token is blacklisted (user logged out)")
-                return None
+            # Recently verified token: skip JWT verification and Firebase reads
+            cached = _token_cache.get(token_hash)
+            if cached and cached[1] > now:
+                if await self._is_token_blacklisted(token_hash):
+                    logger.info("Token is blacklisted (user logged out)")
+                    return None
+                return cached[0]
             
             token_data = self.jwt.verify_access_token(access_token)
             
@@ -275,13 +342,23 @@ class AuthService:
             if not user_id:
                 return None
 
-            firebase_user = await self.firebase.get_user_by_uid(user_id)
-            user_profile = await self.firebase.get_user_profile(user_id)
+            # Blacklist check (logged out) runs alongside the user lookups
+            is_blacklisted, (firebase_user, user_profile) = await asyncio.gather(
+                self._is_token_blacklisted(token_hash),
+                self._get_user_and_profile(user_id)
+            )
+            
+            if is_blacklisted:
+                logger.info("Token is blacklisted (user logged out)")
+                return None
             
             if not firebase_user or not user_profile:
                 return None
             
-            return self._create_user_response(user_profile, firebase_user)
+            user_response = self._create_user_response(user_profile, firebase_user)
+            expires_at = min(token_data.get('exp', now), now + _TOKEN_CACHE_TTL_SECONDS)
+            _token_cache[token_hash] = (user_response, expires_at)
+            return user_response
             
         except Exception as e:
             logger.error(f"Get user by token failed: {str(e)}")
@@ -303,33 +380,14 @@ class AuthService:
             state = secrets.token_urlsafe(32)
             
             # Store state with flow type and timestamp
-            _oauth_states[state] = {
-                "flow_type": flow_type,
-                "timestamp": datetime.now(timezone.utc).timestamp(),
-                "ip": request.client.host if request.client else "unknown"
-            }
-            
-            # Clean up old states (older than 10 minutes)
-            current_time = datetime.now(timezone.utc).timestamp()
-            expired_states = [
-                s for s, data in _oauth_states.items()
-                if current_time - data.get("timestamp", 0) > 600
-            ]
-            for s in expired_states:
-                del _oauth_states[s]
-            
-            # Build OAuth URL
-            params = {
-                "client_id": self.google_oauth_config["client_id"],
-                "redirect_uri": self.google_oauth_config["redirect_uri"],
-                "scope": self.google_oauth_config["scope"],
-                "response_type": "code",
-                "state": state,
-                "access_type": "offline",
-                "prompt": "consent"
-            }
+            await self._store_oauth_state(state, OAuthState(
+                flow_type=flow_type,
+                timestamp=time.time(),
+                ip=request.client.host if request.client else "unknown"
+            ))
             
-            auth_url = f"{self.google_oauth_config['auth_url']}?{urllib.parse.urlencode(params)}"
+            # Build OAuth URL (state from token_urlsafe needs no escaping)
+            auth_url = _GOOGLE_OAUTH_URL_PREFIX + state
             
             logger.info(f"Generated Google OAuth URL for {flow_type}")
             return auth_url
@@ -353,15 +411,15 @@ class AuthService:
             AuthResponse: User data with access and refresh tokens
         """
         try:
-            # Verify state
-            if state not in _oauth_states:
+            # Verify and consume state
+            state_data = await self._pop_oauth_state(state)
+            if not state_data:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Invalid OAuth state"
                 )
             
-            flow_type = _oauth_states[state]["flow_type"]
-            del _oauth_states[state]  # Clean up used state
+            flow_type = state_data.flow_type
             
             # Exchange code for tokens
             google_tokens = await self._exchange_google_code_for_tokens(code)
@@ -390,7 +448,10 @@ class AuthService:
             if existing_user:
                 # Existing user login
                 user_id = existing_user['uid']
-                user_profile = await self.firebase.get_user_profile(user_id)
+                user_profile, tokens = await asyncio.gather(
+                    self.firebase.get_user_profile(user_id),
+                    self._generate_token_pair(user_id)
+                )
                 
                 if not user_profile:
                     # Create profile if missing
@@ -402,7 +463,7 @@ class AuthService:
                     )
                 
                 # Update last login
-                await self._update_last_login(user_id)
+                self._schedule_last_login_update(user_id)
                 
             else:
                 # New user signup
@@ -419,14 +480,15 @@ class AuthService:
                 )
                 
                 existing_user = firebase_user
+                
+                # Generate JWT tokens
+                tokens = await self._generate_token_pair(user_id)
             
-            # Generate JWT tokens
-            tokens = await self._generate_token_pair(user_id)
             user_response = self._create_user_response(user_profile, existing_user)
             
             logger.info(f"Google OAuth {flow_type} successful for: {google_user_info['email']}")
             
-            return AuthResponse(
+            return AuthResponse.model_construct(
                 user=user_response,
                 token=tokens['access_token'],
                 refreshToken=tokens['refresh_token']
@@ -481,7 +543,8 @@ class AuthService:
             
             # Fallback to Firebase Admin SDK if client service fails
             from firebase_admin import auth
-            user_record = auth.create_user(
+            user_record = await asyncio.to_thread(
+                auth.create_user,
                 email=email,
                 password=password,
                 display_name=display_name,
@@ -511,11 +574,12 @@ class AuthService:
             'full_name': full_name
         }
         
-        success = await self.firebase.create_user_profile(uid, user_data)
-        if not success:
+        # the written profile is returned directly, no need to read it back
+        user_profile = await self.firebase.create_user_profile(uid, user_data)
+        if user_profile is None:
             raise HTTPException(status_code=500, detail="Failed to create user profile")
         
-        return await self.firebase.get_user_profile(uid)
+        return user_profile
 
     async def _authenticate_firebase_user(self, email: str, password: str) -> Optional[Dict[str, Any]]:
         """Authenticate user with Firebase Auth using proper password verification"""
@@ -535,12 +599,35 @@ class AuthService:
             logger.error(f"Firebase authentication error: {str(e)}")
             return None
 
+    async def _get_user_and_profile(self, uid: str) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Fetch Firebase user and Firestore profile, memoized for the current request"""
+        cache = request_cache.get()
+        key = ('user_and_profile', uid)
+        if cache is not None and key in cache:
+            return cache[key]
+        
+        firebase_user, user_profile = await asyncio.gather(
+            self.firebase.get_user_by_uid(uid),
+            self.firebase.get_user_profile(uid)
+        )
+        if cache is not None:
+            cache[key] = (firebase_user, user_profile)
+        return firebase_user, user_profile
+
     async def _generate_token_pair(self, user_id: str) -> Dict[str, str]:
         """Generate access and refresh token pair"""
         token_data = {"sub": user_id}
         
-        access_token = self.jwt.create_access_token(token_data)
-        refresh_token = self.jwt.create_refresh_token(token_data)
+        if settings.JWT_ALGORITHM.startswith("HS"):
+            # HMAC signing takes microseconds; a thread hop would cost more
+            access_token = self.jwt.create_access_token(token_data)
+            refresh_token = self.jwt.create_refresh_token(token_data)
+        else:
+            # RSA/EC signing is slow enough to keep off the event loop
+            access_token, refresh_token = await asyncio.gather(
+                asyncio.to_thread(self.jwt.create_access_token, token_data),
+                asyncio.to_thread(self.jwt.create_refresh_token, token_data)
+            )
         
         return {
             "access_token": access_token,
@@ -549,50 +636,101 @@ class AuthService:
 
     def _create_user_response(self, user_profile: Dict[str, Any], firebase_user: Dict[str, Any]) -> UserResponse:
         """Create UserResponse from profile and Firebase user data"""
-        return UserResponse(
-            id=firebase_user['uid'],
-            email=firebase_user['email'],
-            fullName=user_profile.get('full_name', user_profile.get('display_name', '')),
-            provider=user_profile.get('provider', 'email')
+        return _build_user_response(
+            firebase_user['uid'],
+            firebase_user['email'],
+            user_profile.get('full_name', user_profile.get('display_name', '')),
+            user_profile.get('provider', 'email')
         )
 
     async def _update_last_login(self, uid: str) -> None:
         """Update user's last login timestamp"""
-        await self.firebase.update_user_profile(uid, {
-            'last_login': datetime.now(timezone.utc)
-        })
+        try:
+            await self.firebase.update_user_profile(uid, {
+                'last_login': firestore.SERVER_TIMESTAMP
+            })
+        except Exception as e:
+            # runs as a background task, so nobody awaits the error
+            logger.error(f"Failed to update last login for {uid}: {str(e)}")
+    
+    def _schedule_last_login_update(self, uid: str) -> None:
+        """Run _update_last_login in the background without delaying the login response"""
+        task = asyncio.create_task(self._update_last_login(uid))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
     
-    def _cleanup_expired_tokens(self) -> None:
+    @staticmethod
+    def _hash_token(token: str) -> bytes:
+        """Compact fixed-size key for a token in the blacklist"""
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+    
+    async def _blacklist_token(self, token_hash: bytes, exp: float) -> None:
+        """Blacklist a token (by hash) until its expiry time"""
+        if self.redis:
+            # Redis drops the key by itself once the token would have expired
+            ttl = max(1, int(exp - time.time()))
+            await self.redis.setex(f"bl:{token_hash.hex()}", ttl, b"1")
+            return
+        
+        if token_hash not in _blacklisted_hashes:
+            _blacklisted_hashes.add(token_hash)
+            heapq.heappush(_blacklist_heap, (exp, token_hash))
+    
+    async def _is_token_blacklisted(self, token_hash: bytes) -> bool:
+        """Check whether a token (by hash) was blacklisted on logout"""
+        if self.redis:
+            return bool(await self.redis.exists(f"bl:{token_hash.hex()}"))
+        
+        # expired entries are swept by blacklist_cleanup_loop; a stale hit is
+        # harmless since the expired token fails verification anyway
+        return token_hash in _blacklisted_hashes
+    
+    @staticmethod
+    def _cleanup_expired_tokens() -> None:
         """
         Clean up expired tokens from blacklist.
-        simple cleanup for now.
+        Pops entries off the expiry heap, so no token needs to be decoded again.
         """
-        expired_tokens = []
-        current_time = datetime.now(timezone.utc).timestamp()
-        
-        for token in self._blacklisted_tokens:
-            try:
-                # Try to decode token to check expiration
-                payload = self.jwt.verify_token(token)
-                if not payload or payload.get('exp', 0) < current_time:
-                    expired_tokens.append(token)
-            except Exception:
-                # If token can't be decoded, it's probably expired/invalid
-                expired_tokens.append(token)
+        current_time = time.time()
+        removed_count = 0
         
-        for token in expired_tokens:
-            self._blacklisted_tokens.discard(token)
+        while _blacklist_heap and _blacklist_heap[0][0] < current_time:
+            _, token_hash = heapq.heappop(_blacklist_heap)
+            _blacklisted_hashes.discard(token_hash)
+            removed_count += 1
         
-        if expired_tokens:
-            logger.info(f"Cleaned up {len(expired_tokens)} expired tokens from blacklist")
+        if removed_count:
+            logger.info(f"Cleaned up {removed_count} expired tokens from blacklist")
 
     ### PRIVATE HELPER METHODS FOR GOOGLE OAUTH
     
+    async def _store_oauth_state(self, state: str, state_data: OAuthState) -> None:
+        """Store OAuth state for the callback, expiring after 10 minutes"""
+        if self.redis:
+            await self.redis.set(f"oauth:state:{state}", orjson.dumps(asdict(state_data)), ex=_OAUTH_STATE_TTL_SECONDS)
+            return
+        
+        # Clean up old states (older than 10 minutes) from the oldest end
+        expire_before = time.time() - _OAUTH_STATE_TTL_SECONDS
+        while _oauth_states and next(iter(_oauth_states.values())).timestamp < expire_before:
+            _oauth_states.popitem(last=False)
+        
+        _oauth_states[state] = state_data
+    
+    async def _pop_oauth_state(self, state: str) -> Optional[OAuthState]:
+        """Fetch and remove stored OAuth state so it can only be used once"""
+        if self.redis:
+            # GETDEL (Redis 6.2+) reads and removes the state in one atomic step
+            raw_state = await self.redis.getdel(f"oauth:state:{state}")
+            return OAuthState(**orjson.loads(raw_state)) if raw_state else None
+        
+        return _oauth_states.pop(state, None)
+    
     async def _exchange_google_code_for_tokens(self, code: str) -> Dict[str, Any]:
         """Exchange authorization code for access tokens"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
+            async with timeout(_GOOGLE_OAUTH_TIMEOUT_SECONDS):
+                response = await get_http_client().post(
                     self.google_oauth_config["token_url"],
                     data={
                         "client_id": self.google_oauth_config["client_id"],
@@ -602,18 +740,18 @@ class AuthService:
                         "redirect_uri": self.google_oauth_config["redirect_uri"],
                     }
                 )
+            
+            if response.status_code != 200:
+                logger.error(f"Token exchange failed: {response.text}")
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Failed to exchange authorization code"
+                )
+            
+            return orjson.loads(response.content)
                 
-                if response.status_code != 200:
-                    logger.error(f"Token exchange failed: {response.text}")
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="Failed to exchange authorization code"
-                    )
-                
-                return response.json()
-                
-        except httpx.HTTPError as e:
-            logger.error(f"HTTP error during token exchange: {str(e)}")
+        except (httpx.HTTPError, asyncio.TimeoutError) as e:
+            logger.error(f"HTTP error during token exchange: {e!r}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Token exchange failed"
@@ -622,23 +760,23 @@ class AuthService:
     async def _get_google_user_info(self, access_token: str) -> Dict[str, Any]:
         """Get user information from Google API"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
+            async with timeout(_GOOGLE_OAUTH_TIMEOUT_SECONDS):
+                response = await get_http_client().get(
                     self.google_oauth_config["userinfo_url"],
                     headers={"Authorization": f"Bearer {access_token}"}
                 )
+            
+            if response.status_code != 200:
+                logger.error(f"User info request failed: {response.text}")
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Failed to get user information"
+                )
+            
+            return orjson.loads(response.content)
                 
-                if response.status_code != 200:
-                    logger.error(f"User info request failed: {response.text}")
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="Failed to get user information"
-                    )
-                
-                return response.json()
-                
-        except httpx.HTTPError as e:
-            logger.error(f"HTTP error during user info request: {str(e)}")
+        except (httpx.HTTPError, asyncio.TimeoutError) as e:
+            logger.error(f"HTTP error during user info request: {e!r}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to get user information"
@@ -649,7 +787,9 @@ class AuthService:
         try:
             from firebase_admin import auth
             
-            user_record = auth.create_user(
+            # Admin SDK call is blocking HTTP, keep it off the event loop
+            user_record = await asyncio.to_thread(
+                auth.create_user,
                 email=google_user_info["email"],
                 display_name=google_user_info.get("name", ""),
                 email_verified=google_user_info.get("verified_email", False)
@@ -667,4 +807,11 @@ class AuthService:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to create user account"
-            )
\ No newline at end of file
+            )
+
+
+async def blacklist_cleanup_loop() -> None:
+    """Periodically drop expired tokens from the in-memory blacklist (started on app startup)"""
+    while True:
+        await asyncio.sleep(_BLACKLIST_CLEANUP_INTERVAL_SECONDS)
+        AuthService._cleanup_expired_tokens()
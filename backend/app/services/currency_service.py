@@ -1,6 +1,16 @@
-import requests
-from typing import Optional
+import asyncio
+import httpx
+import orjson
+from typing import Optional, Dict
+from cachetools import TTLCache
 from app.core.config import settings
+from app.services.http_client import get_http_client
+
+# /latest/USD returns every rate in one call and rates move at most hourly,
+# so keep the whole conversion_rates dict for an hour
+_RATES_CACHE_TTL_SECONDS = 3600
+_rates_cache: TTLCache = TTLCache(maxsize=1, ttl=_RATES_CACHE_TTL_SECONDS)
+_rates_lock = asyncio.Lock()
 
 class CurrencyService:
     """
@@ -9,7 +19,7 @@ class CurrencyService:
     BASE_URL = f"https://v6.exchangerate-api.com/v6/{settings.ExchangeRate_API_KEY}"
 
 
-    def get_exchange_rate_to_usd(self, target_currency_code: str) -> str:
+    async def get_exchange_rate_to_usd(self, target_currency_code: str) -> str:
         """
         Fetches the exchange rate of a target currency to USD.
         Assumes the base currency for the API call is USD.
@@ -21,21 +31,43 @@ class CurrencyService:
             Optional[float]: The exchange rate of the target currency to 1 USD,
                              or None if the currency code is invalid or API call fails.
         """
-        try:
-            url = f"{self.BASE_URL}/latest/USD"
-            response = requests.get(url, timeout=5)
-            response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
-            
-            data = response.json()
-            if data.get("result") == "success":
-                rate = data.get("conversion_rates", {}).get(target_currency_code.upper())
-                return f"The current exchange rate for {target_currency_code} is {rate}."
-            else:
-                print(f"Error from ExchangeRate-API: {data.get('error-type')}")
-                return None
-            
-        except (requests.RequestException, ValueError, KeyError) as e:
-            print(f"[CurrencyService Error] {e}")
+        rates = await self._get_usd_rates()
+        if rates is None:
             return None
 
-currency_service = CurrencyService()
\ No newline at end of file
+        rate = rates.get(target_currency_code.upper())
+        return f"The current exchange rate for {target_currency_code} is {rate}."
+
+    ### PRIVATE HELPER METHODS
+
+    async def _get_usd_rates(self) -> Optional[Dict[str, float]]:
+        """Returns the cached USD conversion_rates, fetching them once per TTL window"""
+        rates = _rates_cache.get("USD")
+        if rates is not None:
+            return rates
+
+        # single fetch on expiry; concurrent callers wait and reuse its result
+        async with _rates_lock:
+            rates = _rates_cache.get("USD")
+            if rates is not None:
+                return rates
+
+            try:
+                url = f"{self.BASE_URL}/latest/USD"
+                response = await get_http_client().get(url, timeout=5)
+                response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
+                
+                data = orjson.loads(response.content)
+                if data.get("result") == "success":
+                    rates = data.get("conversion_rates", {})
+                    _rates_cache["USD"] = rates
+                    return rates
+                else:
+                    print(f"Error from ExchangeRate-API: {data.get('error-type')}")
+                    return None
+                
+            except (httpx.HTTPError, ValueError, KeyError) as e:
+                print(f"[CurrencyService Error] {e}")
+                return None
+
+currency_service = CurrencyService()
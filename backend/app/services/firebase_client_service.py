@@ -1,16 +1,28 @@
-import requests
+import httpx
+import orjson
+from urllib.parse import quote
 import logging
 from typing import Optional, Dict, Any
 from app.core.config import settings
+from app.services.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
+# payloads are serialized with orjson up front and sent as raw content
+_JSON_HEADERS = {"content-type": "application/json"}
+
 class FirebaseClientService:
     """Firebase Client Authentication Service using REST API"""
     
     def __init__(self):
         self.api_key = settings.FIREBASE_WEB_API_KEY
         self.base_url = "https://identitytoolkit.googleapis.com/v1/accounts"
+        
+        # endpoint URLs with the API key already encoded in the query string
+        key = quote(self.api_key or "")
+        self._sign_in_url = f"{self.base_url}:signInWithPassword?key={key}"
+        self._sign_up_url = f"{self.base_url}:signUp?key={key}"
+        self._update_url = f"{self.base_url}:update?key={key}"
     
     async def sign_in_with_email_password(self, email: str, password: str) -> Optional[Dict[str, Any]]:
         """
@@ -24,19 +36,16 @@ class FirebaseClientService:
             Dict containing user data and tokens if successful, None if failed
         """
         try:
-            url = f"{self.base_url}:signInWithPassword"
-            params = {"key": self.api_key}
-            
             payload = {
                 "email": email,
                 "password": password,
                 "returnSecureToken": True
             }
             
-            response = requests.post(url, params=params, json=payload)
+            response = await get_http_client().post(self._sign_in_url, content=orjson.dumps(payload), headers=_JSON_HEADERS)
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 return {
                     "success": True,
                     "uid": data.get("localId"),
@@ -47,12 +56,12 @@ class FirebaseClientService:
                     "display_name": data.get("displayName", "")
                 }
             else:
-                error_data = response.json()
+                error_data = orjson.loads(response.content)
                 error_message = error_data.get("error", {}).get("message", "Authentication failed")
                 logger.warning(f"Firebase sign-in failed for {email}: {error_message}")
                 return None
                 
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Network error during Firebase sign-in: {str(e)}")
             return None
         except Exception as e:
@@ -72,19 +81,16 @@ class FirebaseClientService:
             Dict containing user data if successful, None if failed
         """
         try:
-            url = f"{self.base_url}:signUp"
-            params = {"key": self.api_key}
-            
             payload = {
                 "email": email,
                 "password": password,
                 "returnSecureToken": True
             }
             
-            response = requests.post(url, params=params, json=payload)
+            response = await get_http_client().post(self._sign_up_url, content=orjson.dumps(payload), headers=_JSON_HEADERS)
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 
                 user_data = {
                     "success": True,
@@ -101,7 +107,7 @@ class FirebaseClientService:
                 
                 return user_data
             else:
-                error_data = response.json()
+                error_data = orjson.loads(response.content)
                 error_message = error_data.get("error", {}).get("message", "User creation failed")
                 logger.warning(f"Firebase user creation failed for {email}: {error_message}")
                 
@@ -113,7 +119,7 @@ class FirebaseClientService:
                 else:
                     return {"success": False, "error": "UNKNOWN", "message": error_message}
                 
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Network error during Firebase user creation: {str(e)}")
             return None
         except Exception as e:
@@ -132,57 +138,17 @@ class FirebaseClientService:
             True if successful, False otherwise
         """
         try:
-            url = f"{self.base_url}:update"
-            params = {"key": self.api_key}
-            
             payload = {
                 "idToken": id_token,
                 "displayName": display_name,
                 "returnSecureToken": False
             }
             
-            response = requests.post(url, params=params, json=payload)
+            response = await get_http_client().post(self._update_url, content=orjson.dumps(payload), headers=_JSON_HEADERS)
             return response.status_code == 200
             
         except Exception as e:
             logger.error(f"Error updating user profile: {str(e)}")
             return False
-    
-    async def verify_id_token(self, id_token: str) -> Optional[Dict[str, Any]]:
-        """
-        Verify Firebase ID token and get user info
-        
-        Args:
-            id_token: Firebase ID token to verify
-            
-        Returns:
-            Dict containing user data if valid, None if invalid
-        """
-        try:
-            url = f"{self.base_url}:lookup"
-            params = {"key": self.api_key}
-            
-            payload = {
-                "idToken": id_token
-            }
-            
-            response = requests.post(url, params=params, json=payload)
-            
-            if response.status_code == 200:
-                data = response.json()
-                users = data.get("users", [])
-                if users:
-                    user = users[0]
-                    return {
-                        "uid": user.get("localId"),
-                        "email": user.get("email"),
-                        "display_name": user.get("displayName", ""),
-                        "email_verified": user.get("emailVerified", False)
-                    }
-            return None
-            
-        except Exception as e:
-            logger.error(f"Error verifying ID token: {str(e)}")
-            return None
 
 firebase_client_service = FirebaseClientService() 
\ No newline at end of file
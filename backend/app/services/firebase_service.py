@@ -1,20 +1,36 @@
-import json
+import asyncio
+import hashlib
+import orjson
+import threading
+import time
 import firebase_admin
 from firebase_admin import credentials, auth, firestore
 from typing import Optional, Dict, Any
+from cachetools import TTLCache
 from app.core.config import settings
+from app.services.firestore_service import evict_user_profile
 from datetime import datetime, timezone
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Verified ID tokens: token hash -> (decoded claims, expires_at), so a token is
+# only checked cryptographically once per 5 minutes (or until its exp, if sooner)
+_ID_TOKEN_CACHE_TTL_SECONDS = 300
+_id_token_cache: TTLCache = TTLCache(maxsize=10000, ttl=_ID_TOKEN_CACHE_TTL_SECONDS)
+
 class FirebaseService:
     _instance = None
+    # FirebaseService() is also called from worker threads; only one may initialize the SDK
+    _init_lock = threading.Lock()
 
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(FirebaseService, cls).__new__(cls)
-            cls._instance._initialize()
+            with cls._init_lock:
+                if cls._instance is None:
+                    instance = super(FirebaseService, cls).__new__(cls)
+                    instance._initialize()
+                    cls._instance = instance
         return cls._instance
     
     def _initialize(self):
@@ -24,7 +40,7 @@ class FirebaseService:
             if not service_account_key:
                 raise ValueError("FIREBASE_SERVICE_ACCOUNT_KEY not found in environment variables")
             
-            service_account_info = json.loads(service_account_key)
+            service_account_info = orjson.loads(service_account_key)
             cred = credentials.Certificate(service_account_info)
 
             # initializing the app if not initialized
@@ -38,7 +54,7 @@ class FirebaseService:
             # initializing the Firestore db
             self._db = firestore.client()
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse Firebase credentials JSON: {e}")
             raise ValueError("Invalid JSON format in FIREBASE_SERVICE_ACCOUNT_KEY")
         except Exception as e:
@@ -47,8 +63,15 @@ class FirebaseService:
     
     async def verify_id_token(self, id_token: str) -> Optional[Dict[str, Any]]:
         """Verify Firebase ID token and return decoded token"""
+        token_hash = hashlib.blake2b(id_token.encode(), digest_size=16).digest()
+        now = time.time()
+        cached = _id_token_cache.get(token_hash)
+        if cached and cached[1] > now:
+            return cached[0]
+        
         try:
-            decoded_token = auth.verify_id_token(id_token)
+            decoded_token = await asyncio.to_thread(auth.verify_id_token, id_token)
+            _id_token_cache[token_hash] = (decoded_token, min(decoded_token['exp'], now + _ID_TOKEN_CACHE_TTL_SECONDS))
             return decoded_token
         except auth.InvalidIdTokenError:
             logger.warning("Invalid ID token provided")
@@ -63,7 +86,7 @@ class FirebaseService:
     async def get_user_by_uid(self, uid: str) -> Optional[Dict[str, Any]]:
         """Get user information from Firebase Auth"""
         try:
-            user_record = auth.get_user(uid)
+            user_record = await asyncio.to_thread(auth.get_user, uid)
             return {
                 'uid': user_record.uid,
                 'email': user_record.email,
@@ -82,7 +105,7 @@ class FirebaseService:
     async def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """Get user information from Firebase Auth by email"""
         try:
-            user_record = auth.get_user_by_email(email)
+            user_record = await asyncio.to_thread(auth.get_user_by_email, email)
             return {
                 'uid': user_record.uid,
                 'email': user_record.email,
@@ -98,32 +121,34 @@ class FirebaseService:
             logger.error(f"Error getting user by email: {str(e)}")
             return None
         
-    async def create_user_profile(self, uid: str, user_data: Dict[str, Any]) -> bool:
-        """Create user profile in Firestore"""
+    async def create_user_profile(self, uid: str, user_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Create user profile in Firestore, returning the written profile (None on failure)"""
         try:
             user_ref = self._db.collection('users').document(uid)
+            now = datetime.now(timezone.utc)
             
             profile_data = {
                 'uid': uid,
                 'email': user_data.get('email'),
                 'display_name': user_data.get('display_name'),
-                'created_at': datetime.now(timezone.utc),
-                'updated_at': datetime.now(timezone.utc)
+                'created_at': now,
+                'updated_at': now
             }
 
-            user_ref.set(profile_data, merge=True)
+            await asyncio.to_thread(user_ref.set, profile_data, merge=True)
+            evict_user_profile(uid)
             logger.info(f"user profile created for uid: {uid}")
-            return True
+            return profile_data
         
         except Exception as e:
             logger.error(f"Error creating user profile: {str(e)}")
-            return False
+            return None
         
     async def get_user_profile(self, uid: str) -> Optional[Dict[str, Any]]:
         """Get user profile from Firestore"""
         try:
             user_ref = self._db.collection('users').document(uid)
-            doc = user_ref.get()
+            doc = await asyncio.to_thread(user_ref.get)
 
             if doc.exists:
                 return doc.to_dict()
@@ -138,9 +163,10 @@ class FirebaseService:
         try:
             user_ref = self._db.collection('users').document(uid)
             
-            update_data['updated_at'] = datetime.now(timezone.utc)
+            update_data['updated_at'] = firestore.SERVER_TIMESTAMP
             
-            user_ref.update(update_data)
+            await asyncio.to_thread(user_ref.update, update_data)
+            evict_user_profile(uid)
             logger.info(f"User profile updated for uid: {uid}")
             return True
             
@@ -164,11 +190,11 @@ class FirebaseService:
             )
 
             conversation_data.update({
-                'updated_at': datetime.now(timezone.utc),
+                'updated_at': firestore.SERVER_TIMESTAMP,
                 'user_id': uid
             })
 
-            conversation_ref.set(conversation_data, merge=True)
+            await asyncio.to_thread(conversation_ref.set, conversation_data, merge=True)
             return True
     
         except Exception as e:
@@ -186,7 +212,8 @@ class FirebaseService:
                 .limit(limit)
             )
 
-            docs = conversations_ref.stream()
+            # materialize the stream inside the worker thread
+            docs = await asyncio.to_thread(lambda: list(conversations_ref.stream()))
             conversations = []
 
             for doc in docs:
@@ -210,7 +237,7 @@ class FirebaseService:
                 .document(conversation_id)
             )
             
-            doc = conversation_ref.get()
+            doc = await asyncio.to_thread(conversation_ref.get)
             if doc.exists:
                 data = doc.to_dict()
                 data['id'] = doc.id
@@ -231,7 +258,7 @@ class FirebaseService:
                 .document(conversation_id)
             )
             
-            conversation_ref.delete()
+            await asyncio.to_thread(conversation_ref.delete)
             logger.info(f"Conversation deleted: {conversation_id} for user: {uid}")
             return True
             
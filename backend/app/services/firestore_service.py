@@ -1,17 +1,46 @@
+import asyncio
+import itertools
 from google.cloud.firestore_v1 import FieldFilter
-from typing import List, Optional, Dict, Any
+from google.cloud.firestore_v1.field_path import FieldPath
+from typing import List, Optional, Dict, Any, AsyncIterator
 from datetime import datetime, timedelta, timezone, date
 import uuid
 import logging
 import firebase_admin
+from cachetools import TTLCache
 from firebase_admin import firestore
+from google.cloud.firestore import AsyncClient, Client
 
-from app.schemas.chat_schemas import ChatMessage
+from app.schemas.chat_schemas import ChatMessage, ToolCall
 from app.schemas.conversation_schemas import Conversation, ConversationMetadata
 from app.schemas.user_schemas import UserProfile, SavedItineraryDocument
 
 logger = logging.getLogger(__name__)
 
+_CONVERSATION_METADATA_FIELDS = ['title', 'created_at', 'updated_at', 'user_id', 'message_count', 'is_guest']
+
+# Most values Firestore accepts in a single 'in' filter
+_IN_FILTER_MAX_VALUES = 30
+
+# Most writes Firestore accepts in a single batch commit
+_BATCH_WRITE_LIMIT = 500
+
+# Hot reads (conversation_id -> Conversation, user_id -> UserProfile) memoized for a few
+# seconds and shared by the whole client pool; writes through this service evict them
+_READ_CACHE_TTL_SECONDS = 5
+_conversation_cache: TTLCache = TTLCache(maxsize=1024, ttl=_READ_CACHE_TTL_SECONDS)
+_user_profile_cache: TTLCache = TTLCache(maxsize=1024, ttl=_READ_CACHE_TTL_SECONDS)
+
+def evict_user_profile(user_id: str) -> None:
+    """Drop a memoized profile; for code that writes users/{user_id} outside this service"""
+    _user_profile_cache.pop(user_id, None)
+
+# Fields user_owns_conversation needs from a conversation
+_CONVERSATION_OWNER_FIELDS = ['user_id', 'is_guest']
+
+class InvalidCursorError(ValueError):
+    """A start_after cursor names a document that does not exist or belongs to another user."""
+
 class FirestoreService:
     def __init__(self):
         """Initialize Firestore client using existing Firebase app"""
@@ -22,7 +51,18 @@ class FirestoreService:
                 from app.services.firebase_service import FirebaseService
                 FirebaseService() 
             
-            self.db = firestore.client()
+            # native asyncio client with its own gRPC channel (see get_firestore_service)
+            app = firebase_admin.get_app()
+            self.db = AsyncClient(
+                project=app.project_id,
+                credentials=app.credential.get_credential()
+            )
+            # BulkWriter only runs on a sync client; keep one per instance instead of
+            # letting every AsyncClient.bulk_writer() call build its own sync copy
+            self._sync_db = Client(
+                project=app.project_id,
+                credentials=app.credential.get_credential()
+            )
             logger.info("Firestore client initialized successfully using Firebase Admin SDK!")
         except Exception as e:
             logger.error(f"Failed to initialize Firestore client: {e}")
@@ -34,7 +74,8 @@ class FirestoreService:
         """Create a new conversation"""
         try:
             doc_ref = self.db.collection('conversations').document(conversation.id)
-            doc_ref.set(conversation.model_dump())
+            await doc_ref.set(conversation.model_dump())
+            _conversation_cache.pop(conversation.id, None)
             logger.info(f"Created conversation: {conversation.id}")
             return conversation.id
         except Exception as e:
@@ -43,13 +84,20 @@ class FirestoreService:
 
     async def get_conversation(self, conversation_id: str) -> Optional[Conversation]:
         """Get a conversation by ID"""
+        cached = _conversation_cache.get(conversation_id)
+        if cached is not None:
+            return cached
+        
         try:
             doc_ref = self.db.collection('conversations').document(conversation_id)
-            doc = doc_ref.get()
+            doc = await doc_ref.get()
 
             if doc.exists:
                 data = doc.to_dict()
-                return Conversation(**data)
+                # stored docs were validated on write, skip re-validating them
+                conversation = Conversation.model_construct(**data)
+                _conversation_cache[conversation_id] = conversation
+                return conversation
             return None
         except Exception as e:
             logger.error(f"Failed to get conversation {conversation_id}: {e}")
@@ -59,8 +107,9 @@ class FirestoreService:
         """Update conversation metadata"""
         try:
             doc_ref = self.db.collection('conversations').document(conversation_id)
-            updates['updated_at'] = datetime.now(timezone.utc)
-            doc_ref.update(updates)
+            updates['updated_at'] = firestore.SERVER_TIMESTAMP
+            await doc_ref.update(updates)
+            _conversation_cache.pop(conversation_id, None)
             logger.info(f"Updated conversation {conversation_id}")
             return True
         except Exception as e:
@@ -70,21 +119,22 @@ class FirestoreService:
     async def delete_conversation(self, conversation_id: str) -> bool:
         """Delete a conversation"""
         try:
-            batch = self.db.batch()
-
-            # delete all messages in the conversation
-            messages_ref = (self.db.collection('conversations')
-                            .document(conversation_id)
-                            .collection('messages'))
-            messages = messages_ref.stream()
-            for message in messages:
-                batch.delete(message.reference)
-            
-            # delete the conversation document
             conv_ref = self.db.collection('conversations').document(conversation_id)
-            batch.delete(conv_ref)
 
-            batch.commit()
+            # message references only, without reading their payloads
+            refs = [ref async for ref in conv_ref.collection('messages').list_documents(page_size=_BATCH_WRITE_LIMIT)]
+            refs.append(conv_ref)
+
+            if len(refs) <= _BATCH_WRITE_LIMIT:
+                # fits in a single atomic batch, one round trip
+                batch = self.db.batch()
+                for ref in refs:
+                    batch.delete(ref)
+                await batch.commit()
+            else:
+                await asyncio.to_thread(self._bulk_delete, refs)
+            _conversation_cache.pop(conversation_id, None)
+
             logger.info(f"Deleted conversation {conversation_id} and all messages")
             return True
         except Exception as e:
@@ -95,48 +145,41 @@ class FirestoreService:
         self,
         user_id: str,
         page: int = 1,
-        page_size: int = 20
-    )-> List[ConversationMetadata]:
-        """get user's conversations with pagination"""
+        page_size: int = 20,
+        start_after: Optional[str] = None
+    )-> AsyncIterator[ConversationMetadata]:
+        """
+        get user's conversations (newest first) with pagination; start_after takes the last id of the previous page.
+        Yields each conversation as Firestore streams it.
+        """
         try:
-            query = (self.db.collection('conversations')
-                     .where(filter=FieldFilter('user_id', '==', user_id)))
+            conversations_ref = self.db.collection('conversations')
+            # only fetch the fields ConversationMetadata needs
+            query = (conversations_ref
+                     .select(_CONVERSATION_METADATA_FIELDS)
+                     .where(filter=FieldFilter('user_id', '==', user_id))
+                     .order_by('updated_at', direction=firestore.Query.DESCENDING)
+                     .limit(page_size))
+            query = await self._paginate(query, conversations_ref, page, page_size, start_after, owner_id=user_id)
             
-            docs = query.stream()
-            conversations = []
-
-            for doc in docs:
+            count = 0
+            now = datetime.now(timezone.utc)
+            async for doc in query.stream():
                 data = doc.to_dict()
                 # Ensure we have all required fields with defaults
-                created_at = data.get('created_at', datetime.now(timezone.utc))
-                updated_at = data.get('updated_at', datetime.now(timezone.utc))
-                
-                if isinstance(created_at, datetime):
-                    created_at = created_at.isoformat()
-                if isinstance(updated_at, datetime):
-                    updated_at = updated_at.isoformat()
-                
                 conversation_data = {
                     'id': doc.id,
                     'title': data.get('title', 'New Conversation'),
-                    'created_at': created_at,
-                    'updated_at': updated_at,
+                    'created_at': data.get('created_at', now),
+                    'updated_at': data.get('updated_at', now),
                     'user_id': data.get('user_id', user_id),
                     'message_count': data.get('message_count', 0),
                     'is_guest': data.get('is_guest', False),
                 }
-                conversations.append(ConversationMetadata(**conversation_data))
-
-            # Sort by updated_at(newest first)
-            conversations.sort(key=lambda x: x.updated_at, reverse=True)
-            
-            # Apply pagination
-            start_idx = (page - 1) * page_size
-            end_idx = start_idx + page_size
-            paginated_conversations = conversations[start_idx:end_idx]
+                count += 1
+                yield ConversationMetadata.model_construct(**conversation_data)
 
-            logger.info(f"Retrieved {len(paginated_conversations)} conversations for user {user_id} (page {page})")
-            return paginated_conversations
+            logger.info(f"Retrieved {count} conversations for user {user_id} (page {page})")
         except Exception as e:
             logger.error(f"Failed to get conversations for user {user_id}: {e}")
             raise
@@ -164,7 +207,8 @@ class FirestoreService:
                 'updated_at': message.timestamp
             })
 
-            batch.commit()
+            await batch.commit()
+            _conversation_cache.pop(message.conversation_id, None)
             return message.id
         except Exception as e:
             logger.error(f"Failed to add message {message.id}: {e}")
@@ -175,29 +219,30 @@ class FirestoreService:
         conversation_id: str,
         page: int = 1,
         page_size: int = 50,
-        order: str = 'asc'
-    ) -> List[ChatMessage]:
-        """Get messages from a conversation"""
+        order: str = 'asc',
+        start_after: Optional[str] = None
+    ) -> AsyncIterator[ChatMessage]:
+        """
+        Get messages from a conversation; start_after takes the last id of the previous page.
+        Yields each message as Firestore streams it.
+        """
         try:
             direction = firestore.Query.ASCENDING if order == 'asc' else firestore.Query.DESCENDING
 
-            query = (self.db.collection('conversations')
-                     .document(conversation_id)
-                     .collection('messages')
+            messages_ref = (self.db.collection('conversations')
+                            .document(conversation_id)
+                            .collection('messages'))
+            query = (messages_ref
                      .order_by('timestamp', direction=direction)
-                     .limit(page_size)
-                     .offset((page - 1) * page_size))
+                     .limit(page_size))
+            query = await self._paginate(query, messages_ref, page, page_size, start_after)
             
-            docs = query.stream()
-            messages = []
-
-            for doc in docs:
-                data = doc.to_dict()
-                messages.append(ChatMessage(**data))
+            count = 0
+            async for doc in query.stream():
+                count += 1
+                yield self._message_from_dict(doc.to_dict())
 
-
-            logger.info(f"Retrieved {len(messages)} messages for conversation {conversation_id}")
-            return messages
+            logger.info(f"Retrieved {count} messages for conversation {conversation_id}")
         except Exception as e:
             logger.error(f"Failed to get messages for conversation {conversation_id}: {e}")
             raise
@@ -207,7 +252,9 @@ class FirestoreService:
         conversation_id: str, 
         limit: int = 20
     ) -> List[ChatMessage]:
-        """Get recent conversation history for AI context"""
+        """
+        Get recent conversation history for AI context.
+        """
         try:
             query = (self.db.collection('conversations')
                     .document(conversation_id)
@@ -215,12 +262,8 @@ class FirestoreService:
                     .order_by('timestamp', direction=firestore.Query.DESCENDING)
                     .limit(limit))
             
-            docs = query.stream()
-            messages = []
-            
-            for doc in docs:
-                data = doc.to_dict()
-                messages.append(ChatMessage(**data))
+            docs = [doc async for doc in query.stream()]
+            messages = [self._message_from_dict(doc.to_dict()) for doc in docs]
             
             # Return in chronological order (oldest first)
             messages.reverse()
@@ -236,7 +279,7 @@ class FirestoreService:
                           .document(conversation_id)
                           .collection('messages')
                           .document(message_id))
-            message_ref.update(updates)
+            await message_ref.update(updates)
             logger.info(f"Updated message {message_id}")
             return True
         except Exception as e:
@@ -249,7 +292,8 @@ class FirestoreService:
         """Create a new user profile"""
         try:
             doc_ref = self.db.collection('users').document(user_profile.uid)
-            doc_ref.set(user_profile.model_dump())
+            await doc_ref.set(user_profile.model_dump())
+            _user_profile_cache.pop(user_profile.uid, None)
             logger.info(f"Created user profile: {user_profile.uid}")
             return user_profile.uid
         except Exception as e:
@@ -258,13 +302,19 @@ class FirestoreService:
 
     async def get_user_profile(self, user_id: str) -> Optional[UserProfile]:
         """Get user profile by ID"""
+        cached = _user_profile_cache.get(user_id)
+        if cached is not None:
+            return cached
+        
         try:
             doc_ref = self.db.collection('users').document(user_id)
-            doc = doc_ref.get()
+            doc = await doc_ref.get()
             
             if doc.exists:
                 data = doc.to_dict()
-                return UserProfile(**data)
+                user_profile = self._user_profile_from_dict(data)
+                _user_profile_cache[user_id] = user_profile
+                return user_profile
             return None
         except Exception as e:
             logger.error(f"Failed to get user profile {user_id}: {e}")
@@ -274,8 +324,9 @@ class FirestoreService:
         """Update user profile"""
         try:
             doc_ref = self.db.collection('users').document(user_id)
-            updates['updated_at'] = datetime.now(timezone.utc)
-            doc_ref.update(updates)
+            updates['updated_at'] = firestore.SERVER_TIMESTAMP
+            await doc_ref.update(updates)
+            _user_profile_cache.pop(user_id, None)
             logger.info(f"Updated user profile {user_id}")
             return True
         except Exception as e:
@@ -298,18 +349,13 @@ class FirestoreService:
             if isinstance(itinerary_dict.get('end_date'), date) and not isinstance(itinerary_dict['end_date'], datetime):
                 itinerary_dict['end_date'] = datetime.combine(itinerary_dict['end_date'], datetime.min.time()).replace(tzinfo=timezone.utc)
             
-            # Use set with merge to ensure the document exists, then update with array union
-            # First ensure the document exists with empty itineraries array if needed
-            doc_ref.set({
-                'saved_itineraries': [],
-                'updated_at': datetime.now(timezone.utc)
-            }, merge=True)
-            
-            # Then add the new itinerary
-            doc_ref.update({
+            # set with merge creates the document/array if missing, ArrayUnion appends
+            # without touching itineraries that are already saved
+            await doc_ref.set({
                 'saved_itineraries': firestore.ArrayUnion([itinerary_dict]),
-                'updated_at': datetime.now(timezone.utc)
-            })
+                'updated_at': firestore.SERVER_TIMESTAMP
+            }, merge=True)
+            _user_profile_cache.pop(user_id, None)
             
             logger.info(f"Saved itinerary {itinerary_doc.id} for user {user_id}")
             return True
@@ -331,21 +377,30 @@ class FirestoreService:
     async def delete_user_itinerary(self, user_id: str, itinerary_id: str) -> bool:
         """Remove a saved itinerary from user's profile"""
         try:
-            user_profile = await self.get_user_profile(user_id)
-            if not user_profile:
-                return False
-            
-            # Find and remove the itinerary
-            updated_itineraries = [
-                itin for itin in user_profile.saved_itineraries 
-                if itin.id != itinerary_id
-            ]
-            
             doc_ref = self.db.collection('users').document(user_id)
-            doc_ref.update({
-                'saved_itineraries': [itin.model_dump() for itin in updated_itineraries],
-                'updated_at': datetime.now(timezone.utc)
-            })
+
+            # read and remove in one transaction so concurrent saves/deletes aren't lost
+            @firestore.async_transactional
+            async def remove_itinerary(transaction) -> bool:
+                snapshot = await doc_ref.get(transaction=transaction)
+                if not snapshot.exists:
+                    return False
+                
+                # ArrayRemove matches whole stored entries, so pass them exactly as read
+                targets = [
+                    itin for itin in (snapshot.to_dict().get('saved_itineraries') or [])
+                    if itin.get('id') == itinerary_id
+                ]
+                if targets:
+                    transaction.update(doc_ref, {
+                        'saved_itineraries': firestore.ArrayRemove(targets),
+                        'updated_at': firestore.SERVER_TIMESTAMP
+                    })
+                return True
+            
+            if not await remove_itinerary(self.db.transaction()):
+                return False
+            _user_profile_cache.pop(user_id, None)
             
             logger.info(f"Deleted itinerary {itinerary_id} for user {user_id}")
             return True
@@ -357,9 +412,13 @@ class FirestoreService:
     async def conversation_exists(self, conversation_id: str) -> bool:
         """Check if a conversation exists"""
         try:
-            doc_ref = self.db.collection('conversations').document(conversation_id)
-            doc = doc_ref.get()
-            return doc.exists
+            conversations_ref = self.db.collection('conversations')
+            # server-side count on the doc id: a single scalar back, no document payload
+            query = (conversations_ref
+                     .where(filter=FieldFilter(FieldPath.document_id(), '==', conversations_ref.document(conversation_id)))
+                     .limit(1))
+            result = await query.count().get()
+            return result[0][0].value > 0
         except Exception as e:
             logger.error(f"Failed to check conversation existence {conversation_id}: {e}")
             return False
@@ -367,18 +426,29 @@ class FirestoreService:
     async def user_owns_conversation(self, user_id: str, conversation_id: str) -> bool:
         """Check if user owns a conversation"""
         try:
-            conversation = await self.get_conversation(conversation_id)
-            if not conversation:
-                return False
-
-            if conversation.is_guest:
-                return True
-            
-            # Check ownership
-            return conversation.user_id == user_id
+            conversation = _conversation_cache.get(conversation_id)
+            if conversation is None:
+                # only the ownership fields, not the whole document
+                doc_ref = self.db.collection('conversations').document(conversation_id)
+                doc = await doc_ref.get(field_paths=_CONVERSATION_OWNER_FIELDS)
+                if doc.exists:
+                    conversation = Conversation.model_construct(**doc.to_dict())
+            return self.is_conversation_owner(conversation, user_id)
         except Exception as e:
             logger.error(f"Failed to check conversation ownership: {e}")
             return False
+
+    @staticmethod
+    def is_conversation_owner(conversation: Optional[Conversation], user_id: str) -> bool:
+        """Ownership check for an already fetched conversation (guest conversations are open)"""
+        if not conversation:
+            return False
+
+        if conversation.is_guest:
+            return True
+        
+        # Check ownership
+        return conversation.user_id == user_id
         
     def generate_id(self, prefix: str = "") -> str:
         """Generate a unique ID with optional prefix"""
@@ -390,16 +460,29 @@ class FirestoreService:
         try:
             cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_old)
             
+            # walk the matches oldest first in windows of _BATCH_WRITE_LIMIT, so neither memory
+            # nor a single stream grows with the backlog (created_at is kept for the cursor)
             query = (self.db.collection('conversations')
                     .where(filter=FieldFilter('is_guest', '==', True))
-                    .where(filter=FieldFilter('created_at', '<', cutoff_date)))
+                    .where(filter=FieldFilter('created_at', '<', cutoff_date))
+                    .order_by('created_at')
+                    .select(['created_at'])
+                    .limit(_BATCH_WRITE_LIMIT))
             
-            docs = query.stream()
             deleted_count = 0
-            
-            for doc in docs:
-                await self.delete_conversation(doc.id)
-                deleted_count += 1
+            cursor = None
+            while True:
+                page_query = query.start_after(cursor) if cursor else query
+                docs = [doc async for doc in page_query.stream()]
+                if not docs:
+                    break
+                
+                await self._delete_conversations([doc.reference for doc in docs])
+                deleted_count += len(docs)
+                
+                if len(docs) < _BATCH_WRITE_LIMIT:
+                    break
+                cursor = docs[-1]
             
             logger.info(f"Cleaned up {deleted_count} anonymous conversations")
             return deleted_count
@@ -407,14 +490,89 @@ class FirestoreService:
             logger.error(f"Failed to cleanup anonymous conversations: {e}")
             return 0
         
+    ### PRIVATE HELPER METHODS
+
+    @staticmethod
+    def _message_from_dict(data: Dict[str, Any]) -> ChatMessage:
+        """Build a ChatMessage from a stored doc without re-validating it"""
+        if data.get('tool_calls'):
+            data['tool_calls'] = [ToolCall.model_construct(**tc) for tc in data['tool_calls']]
+        return ChatMessage.model_construct(**data)
+
+    @staticmethod
+    def _user_profile_from_dict(data: Dict[str, Any]) -> UserProfile:
+        """Build a UserProfile from a stored doc without re-validating it"""
+        if data.get('saved_itineraries'):
+            # itinerary dates are stored as datetimes, so these still need validating back to dates
+            data['saved_itineraries'] = [
+                SavedItineraryDocument.model_validate(itin) for itin in data['saved_itineraries']
+            ]
+        return UserProfile.model_construct(**data)
+
+    @staticmethod
+    async def _paginate(
+        query, collection_ref, page: int, page_size: int, start_after: Optional[str], owner_id: Optional[str] = None
+    ):
+        """
+        Position an ordered query at the requested page. A start_after cursor (doc id) costs
+        one document read, while OFFSET reads and bills every skipped document.
+        Raises InvalidCursorError for a missing anchor, or one not owned by owner_id, rather than
+        restarting from page 1 (a client following cursors would loop).
+        """
+        if start_after:
+            anchor = await collection_ref.document(start_after).get()
+            if not anchor.exists or (owner_id is not None and (anchor.to_dict() or {}).get('user_id') != owner_id):
+                raise InvalidCursorError(f"Invalid start_after cursor: {start_after}")
+            return query.start_after(anchor)
+        return query.offset((page - 1) * page_size) if page > 1 else query
+
+    async def _delete_conversations(self, conv_refs: List[Any]) -> None:
+        """Delete conversations together with all of their messages"""
+        conv_ids = [ref.id for ref in conv_refs]
+        
+        # find their messages with one collection group query per 'in' chunk
+        # of conversation ids (every message stores its conversation_id)
+        message_refs = await asyncio.gather(*(
+            self._list_message_refs(conv_ids[i:i + _IN_FILTER_MAX_VALUES])
+            for i in range(0, len(conv_ids), _IN_FILTER_MAX_VALUES)
+        ))
+        
+        # BulkWriter batches the deletes and commits them in parallel
+        await asyncio.to_thread(
+            self._bulk_delete,
+            [ref for refs in message_refs for ref in refs] + conv_refs
+        )
+        for conv_id in conv_ids:
+            _conversation_cache.pop(conv_id, None)
+
+    async def _list_message_refs(self, conversation_ids: List[str]) -> List[Any]:
+        """References of all messages under the given conversations, without reading their fields"""
+        query = (self.db.collection_group('messages')
+                 .where(filter=FieldFilter('conversation_id', 'in', conversation_ids))
+                 .select([]))
+        return [doc.reference async for doc in query.stream()]
+
+    def _bulk_delete(self, refs: List[Any]) -> None:
+        """
+        Delete documents through a BulkWriter and wait for all writes to finish.
+        BulkWriter is thread-based and runs on the instance's sync client, so run it via to_thread.
+        """
+        bulk_writer = self._sync_db.bulk_writer()
+        for ref in refs:
+            bulk_writer.delete(ref)
+        bulk_writer.close()
+        
 ### Dependency injection
 
-# Singleton instance
-_firestore_service = None
+# Small pool of instances handed out round-robin. Each holds its own AsyncClient and
+# so its own gRPC channel, spreading concurrent RPC bursts over several connections
+# instead of queueing them on one channel's stream limit
+_FIRESTORE_POOL_SIZE = 4
+_firestore_services: List[FirestoreService] = []
+_next_service = itertools.count()
 
 def get_firestore_service() -> FirestoreService:
     """Dependency injection for FirestoreService"""
-    global _firestore_service
-    if _firestore_service is None:
-        _firestore_service = FirestoreService()
-    return _firestore_service  
\ No newline at end of file
+    if not _firestore_services:
+        _firestore_services.extend(FirestoreService() for _ in range(_FIRESTORE_POOL_SIZE))
+    return _firestore_services[next(_next_service) % _FIRESTORE_POOL_SIZE]  
\ No newline at end of file
@@ -1,9 +1,36 @@
+import asyncio
+import logging
 import re 
-import requests
+import hashlib
+import httpx
+import orjson
+import redis
+from cachetools import TTLCache
+from pydantic import TypeAdapter
+from types import MappingProxyType
 from typing import Optional, Dict, Any, List
-from datetime import date, datetime, timedelta
+from datetime import date
 from app.core.config import settings
-from app.schemas.flight_schemas import FlightOffer, Itinerary, Segment
+from app.services.amadeus_token_cache import (
+    bearer_headers, cache_token, get_cached_token, load_shared_token, refresh_lock, store_shared_token
+)
+from app.services.http_client import get_http_client
+from app.services.redis_service import get_redis_client
+from app.schemas.flight_schemas import FlightOffer
+
+logger = logging.getLogger(__name__)
+
+# ISO 8601 flight durations, e.g. "PT13H56M" (matched for every segment and itinerary)
+_DURATION_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?')
+
+# Search results per normalized query: kept in Redis (as JSON) when REDIS_URL is set so
+# every worker shares them, otherwise in this process
+_SEARCH_CACHE_TTL_SECONDS = 900
+_search_cache: TTLCache = TTLCache(maxsize=256, ttl=_SEARCH_CACHE_TTL_SECONDS)
+_flight_offers_adapter = TypeAdapter(List[FlightOffer])
+
+# Static header for the OAuth token request
+_TOKEN_REQUEST_HEADERS = MappingProxyType({'Content-Type': 'application/x-www-form-urlencoded'})
 
 
 class AmadeusAuthError(Exception):
@@ -20,56 +47,52 @@ class FlightService:
     def __init__(self):
         self.api_key = settings.AMADEUS_API_KEY
         self.api_secret = settings.AMADEUS_API_SECRET
-        self._access_token = None
-        self._token_expires_at = None
         
-    def _get_access_token(self) -> str:
+    async def _get_access_token(self) -> str:
         """
         Fetches a new Amadeus access token if current one is missing or expired.
         """
-        if self._access_token and self._token_expires_at and datetime.now() < self._token_expires_at:
-            return self._access_token # Token is still valid
+        access_token = get_cached_token(self.api_key)
+        if access_token:
+            return access_token # Token is still valid
 
-        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
-        data = {
-            'grant_type': 'client_credentials',
-            'client_id': self.api_key,
-            'client_secret': self.api_secret
-        }
+        # one refresh per process at a time (flights and hotels included); other workers' tokens come from Redis
+        async with refresh_lock(self.api_key):
+            access_token = get_cached_token(self.api_key)
+            if access_token:
+                return access_token # refreshed while we waited
 
-        try:
-            response = requests.post(self.AUTH_URL, headers=headers, data=data, timeout=10)
-            response.raise_for_status()
-            auth_data = response.json()
-            self._access_token = auth_data['access_token']
-            # Amadeus returns expires_in in seconds
-            expires_in = auth_data.get('expires_in', 3600) # Default to 1 hour if not specified
-            self._token_expires_at = datetime.now() + timedelta(seconds=expires_in - 60) # Subtract 60s buffer
-            return self._access_token
-        except requests.exceptions.RequestException as e:
-            print(f"Amadeus authentication failed: {e}")
-            raise AmadeusAuthError(f"Failed to get Amadeus access token: {e}")
-        except KeyError as e:
-            print(f"Amadeus authentication response missing key: {e}")
-            raise AmadeusAuthError(f"Amadeus authentication response malformed: {e}")
+            shared_token = await load_shared_token(self.api_key)
+            if shared_token:
+                access_token, ttl = shared_token
+                cache_token(self.api_key, access_token, ttl)
+                return access_token
+
+            data = {
+                'grant_type': 'client_credentials',
+                'client_id': self.api_key,
+                'client_secret': self.api_secret
+            }
+
+            try:
+                response = await get_http_client().post(self.AUTH_URL, headers=_TOKEN_REQUEST_HEADERS, data=data, timeout=10)
+                response.raise_for_status()
+                auth_data = orjson.loads(response.content)
+                access_token = auth_data['access_token']
+                # Amadeus returns expires_in in seconds
+                expires_in = auth_data.get('expires_in', 3600) # Default to 1 hour if not specified
+                ttl = expires_in - 60 # Subtract 60s buffer
+                cache_token(self.api_key, access_token, ttl)
+                await store_shared_token(self.api_key, access_token, ttl)
+                return access_token
+            except httpx.HTTPError as e:
+                logger.error("Amadeus authentication failed: %s", e)
+                raise AmadeusAuthError(f"Failed to get Amadeus access token: {e}")
+            except KeyError as e:
+                logger.error("Amadeus authentication response missing key: %s", e)
+                raise AmadeusAuthError(f"Amadeus authentication response malformed: {e}")
         
-    def _parse_duration(self, duration_str: str) -> str:
-        """
-        Parses an ISO 8601 duration string (e.g., "PT13H56M") into a human-readable format.
-        """
-        match = re.match(r'PT(?:(\d+)H)?(?:(\d+)M)?', duration_str)
-        if match:
-            hours = int(match.group(1)) if match.group(1) else 0
-            minutes = int(match.group(2)) if match.group(2) else 0
-            parts = []
-            if hours > 0:
-                parts.append(f"{hours}h")
-            if minutes > 0:
-                parts.append(f"{minutes}m")
-            return " ".join(parts) if parts else "0m"
-        return duration_str # Return original if parsing fails
-    
-    def search_flight_offers(
+    async def search_flight_offers(
         self,
         origin_code: str,
         destination_code: str,
@@ -85,13 +108,9 @@ class FlightService:
     ) -> Optional[List[FlightOffer]]:
         """
         Searches for flight offers using the Amadeus API.
+        Results are cached for 15 minutes per normalized query.
         """
         try:
-            access_token = self._get_access_token()
-            headers = {
-                'Authorization': f'Bearer {access_token}'
-            }
-
             params = {
                 'originLocationCode': origin_code.upper(),
                 'destinationLocationCode': destination_code.upper(),
@@ -113,61 +132,126 @@ class FlightService:
             if max_flights:
                 params['max'] = max_flights # Amadeus uses 'max' for number of results
 
-            print(f"Amadeus Flight Search URL: {self.API_URL}?{requests.compat.urlencode(params)}")
+            # repeated searches (refreshes, re-opened chats) are answered from the cache
+            cache_key = _search_cache_key(params)
+            cached_offers = await _get_cached_offers(cache_key)
+            if cached_offers is not None:
+                return cached_offers
 
-            response = requests.get(self.API_URL, headers=headers, params=params, timeout=15)
+            headers = bearer_headers(await self._get_access_token())
+
+            logger.debug("Amadeus Flight Search request: %s params=%s", self.API_URL, params)
+
+            response = await get_http_client().get(self.API_URL, headers=headers, params=params, timeout=15)
             response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
 
-            data = response.json()
+            # JSON decode + validation of large responses runs off the event loop
+            flight_offers_list = await asyncio.to_thread(_parse_raw, response.content)
 
-            if not data.get("data"):
-                print("No flight offers found for the given criteria.")
+            if not flight_offers_list:
+                logger.info("No flight offers found for the given criteria.")
                 return None
 
-            # Process the raw Amadeus response into the defined FlightOffer schema
-            flight_offers_list: List[FlightOffer] = []
-            for offer_data in data["data"]:
-                itineraries = []
-                for itin_data in offer_data["itineraries"]:
-                    segments = []
-                    for seg_data in itin_data["segments"]:
-                        segments.append(Segment(
-                            departure_airport_code=seg_data["departure"]["iataCode"],
-                            departure_time=datetime.fromisoformat(seg_data["departure"]["at"]),
-                            arrival_airport_code=seg_data["arrival"]["iataCode"],
-                            arrival_time=datetime.fromisoformat(seg_data["arrival"]["at"]),
-                            carrier_code=seg_data["carrierCode"],
-                            flight_number=seg_data["number"],
-                            duration=self._parse_duration(seg_data["duration"]),
-                            number_of_stops=seg_data["numberOfStops"]
-                        ))
-                    itineraries.append(Itinerary(
-                        duration=self._parse_duration(itin_data["duration"]),
-                        segments=segments
-                    ))
-
-                flight_offers_list.append(FlightOffer(
-                    id=offer_data["id"],
-                    price_total=float(offer_data["price"]["grandTotal"]),
-                    currency=offer_data["price"]["currency"],
-                    itineraries=itineraries,
-                    number_of_bookable_seats=offer_data.get("numberOfBookableSeats", 0), # Default if missing
-                    last_ticketing_date=date.fromisoformat(offer_data["lastTicketingDate"]),
-                    validating_airline_codes=offer_data.get("validatingAirlineCodes", [])
-                ))
+            await _cache_offers(cache_key, flight_offers_list)
             return flight_offers_list
         
         except AmadeusAuthError as e:
-            print(f"Authentication error: {e}")
+            logger.error("Authentication error: %s", e)
             return None
-        except requests.exceptions.RequestException as e:
-            print(f"Amadeus API call failed: {e}")
+        except httpx.HTTPError as e:
+            logger.warning("Amadeus API call failed: %s", e)
             return None
         except (KeyError, TypeError) as e:
-            print(f"Error parsing Amadeus response data: {e}")
+            logger.exception("Error parsing Amadeus response data: %s", e)
             return None
         except Exception as e:
-            print(f"An unexpected error occurred in flight service: {e}")
+            logger.exception("An unexpected error occurred in flight service: %s", e)
             return None
         
+def _parse_duration(duration_str: str) -> str:
+    """
+    Parses an ISO 8601 duration string (e.g., "PT13H56M") into a human-readable format.
+    """
+    match = _DURATION_RE.match(duration_str)
+    if match:
+        hours = int(match.group(1)) if match.group(1) else 0
+        minutes = int(match.group(2)) if match.group(2) else 0
+        parts = []
+        if hours > 0:
+            parts.append(f"{hours}h")
+        if minutes > 0:
+            parts.append(f"{minutes}m")
+        return " ".join(parts) if parts else "0m"
+    return duration_str # Return original if parsing fails
+
+def _parse_raw(content: bytes) -> List[FlightOffer]:
+    """
+    Turns a raw Amadeus flight-offers response body into FlightOffer models.
+    Pure function so it can run in a worker thread.
+    """
+    data = orjson.loads(content)
+
+    # Reshape the raw Amadeus response into FlightOffer fields, then validate the
+    # whole list in one pydantic-core call (it also parses the ISO timestamps/dates)
+    offers_data = []
+    for offer_data in data.get("data") or []:
+        itineraries = []
+        for itin_data in offer_data["itineraries"]:
+            segments = []
+            for seg_data in itin_data["segments"]:
+                segments.append({
+                    "departure_airport_code": seg_data["departure"]["iataCode"],
+                    "departure_time": seg_data["departure"]["at"],
+                    "arrival_airport_code": seg_data["arrival"]["iataCode"],
+                    "arrival_time": seg_data["arrival"]["at"],
+                    "carrier_code": seg_data["carrierCode"],
+                    "flight_number": seg_data["number"],
+                    "duration": _parse_duration(seg_data["duration"]),
+                    "number_of_stops": seg_data["numberOfStops"]
+                })
+            itineraries.append({
+                "duration": _parse_duration(itin_data["duration"]),
+                "segments": segments
+            })
+
+        offers_data.append({
+            "id": offer_data["id"],
+            "price_total": float(offer_data["price"]["grandTotal"]),
+            "currency": offer_data["price"]["currency"],
+            "itineraries": itineraries,
+            "number_of_bookable_seats": offer_data.get("numberOfBookableSeats", 0), # Default if missing
+            "last_ticketing_date": offer_data["lastTicketingDate"],
+            "validating_airline_codes": offer_data.get("validatingAirlineCodes", [])
+        })
+    return _flight_offers_adapter.validate_python(offers_data)
+
+def _search_cache_key(params: Dict[str, Any]) -> str:
+    """Cache key for the normalized Amadeus query parameters"""
+    digest = hashlib.blake2b(orjson.dumps(params, option=orjson.OPT_SORT_KEYS), digest_size=16).hexdigest()
+    return f"flights:search:{digest}"
+
+async def _get_cached_offers(cache_key: str) -> Optional[List[FlightOffer]]:
+    """Cached offers for a query, or None on a miss"""
+    redis_client = get_redis_client()
+    if redis_client is None:
+        return _search_cache.get(cache_key)
+    try:
+        raw_offers = await redis_client.get(cache_key)
+        if raw_offers:
+            return _flight_offers_adapter.validate_json(raw_offers)
+    except redis.RedisError as e:
+        logger.warning("Flight search cache read failed: %s", e)
+    return None
+
+async def _cache_offers(cache_key: str, offers: List[FlightOffer]) -> None:
+    """Store offers for a query (best effort)"""
+    redis_client = get_redis_client()
+    if redis_client is None:
+        _search_cache[cache_key] = offers
+        return
+    try:
+        await redis_client.set(cache_key, _flight_offers_adapter.dump_json(offers), ex=_SEARCH_CACHE_TTL_SECONDS)
+    except redis.RedisError as e:
+        logger.warning("Flight search cache write failed: %s", e)
+
 flight_service = FlightService()
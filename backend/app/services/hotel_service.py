@@ -1,22 +1,42 @@
-import requests
+import asyncio
+import logging
+import weakref
+import httpx
+import orjson
+import redis
+from cachetools import TTLCache
+from pydantic import BaseModel, ValidationError
+from types import MappingProxyType
 from typing import Optional, List, Literal
-from datetime import date, datetime, timedelta
+from datetime import date
 from app.core.config import settings
-from app.schemas.hotel_schemas import (
-    HotelListResponse,
-    HotelOffersResponse,
-    CityHotelInfo,
-    DetailedHotelInfo,
-    HotelOfferDetails,
-    GeoCode,
-    Distance,
-    RoomInfo,
-    GuestInfo,
-    OfferPrice,
-    RoomTypeEstimated,
-    RoomDescription,
-    CancellationPolicy
+from app.services.amadeus_token_cache import (
+    bearer_headers, cache_token, get_cached_token, load_shared_token, refresh_lock, store_shared_token
 )
+from app.services.http_client import get_http_client
+from app.services.redis_service import get_redis_client
+from app.schemas.hotel_schemas import HotelListResponse, HotelOffersResponse, CityHotelInfo
+
+logger = logging.getLogger(__name__)
+
+# Amadeus response envelopes, validated straight from the raw bytes (no intermediate dicts);
+# the schemas map Amadeus' camelCase fields
+class _HotelsByCityPayload(BaseModel):
+    data: List[CityHotelInfo] = []
+
+class _HotelOffersPayload(BaseModel):
+    data: List[HotelOffersResponse] = []
+
+# Hotels per city query rarely change: kept for 6 hours in Redis (as JSON) when
+# REDIS_URL is set so every worker shares them, otherwise in this process
+_CITY_HOTELS_CACHE_TTL_SECONDS = 6 * 3600
+_city_hotels_cache: TTLCache = TTLCache(maxsize=512, ttl=_CITY_HOTELS_CACHE_TTL_SECONDS)
+
+# Upper bound on hotel-offers requests kept in flight at once (Amadeus rate limits)
+_MAX_CONCURRENT_OFFER_REQUESTS = 5
+
+# Static header for the OAuth token request
+_TOKEN_REQUEST_HEADERS = MappingProxyType({'Content-Type': 'application/x-www-form-urlencoded'})
 
 class AmadeusAuthError(Exception):
     """Custom exception for Amadeus authentication failures."""
@@ -33,54 +53,96 @@ class HotelService:
     def __init__(self):
         self.api_key = settings.AMADEUS_API_KEY
         self.api_secret = settings.AMADEUS_API_SECRET
-        self._access_token = None
-        self._token_expires_at = None
+        self._offers_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_OFFER_REQUESTS)
+        # one lock per city query being fetched, dropped once nobody waits on it
+        self._city_hotels_locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
 
-    def _get_access_token(self) -> str:
+    async def _get_access_token(self) -> str:
         """
         Fetches a new Amadeus access token if current one is missing or expired.
         """
-        if self._access_token and self._token_expires_at and datetime.now() < self._token_expires_at:
-            return self._access_token # Token is still valid
+        access_token = get_cached_token(self.api_key)
+        if access_token:
+            return access_token # Token is still valid
 
-        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
-        data = {
-            'grant_type': 'client_credentials',
-            'client_id': self.api_key,
-            'client_secret': self.api_secret
-        }
+        # one refresh per process at a time (flights and hotels included); other workers' tokens come from Redis
+        async with refresh_lock(self.api_key):
+            access_token = get_cached_token(self.api_key)
+            if access_token:
+                return access_token # refreshed while we waited
 
-        try:
-            response = requests.post(self.AUTH_URL, headers=headers, data=data, timeout=10)
-            response.raise_for_status()
-            auth_data = response.json()
-            self._access_token = auth_data['access_token']
-            # Amadeus returns expires_in in seconds
-            expires_in = auth_data.get('expires_in', 3600) # Default to 1 hour if not specified
-            self._token_expires_at = datetime.now() + timedelta(seconds=expires_in - 60) # Subtract 60s buffer
-            return self._access_token
-        except requests.exceptions.RequestException as e:
-            print(f"Amadeus authentication failed: {e}")
-            raise AmadeusAuthError(f"Failed to get Amadeus access token: {e}")
-        except KeyError as e:
-            print(f"Amadeus authentication response missing key: {e}")
-            raise AmadeusAuthError(f"Amadeus authentication response malformed: {e}")
+            shared_token = await load_shared_token(self.api_key)
+            if shared_token:
+                access_token, ttl = shared_token
+                cache_token(self.api_key, access_token, ttl)
+                return access_token
+
+            data = {
+                'grant_type': 'client_credentials',
+                'client_id': self.api_key,
+                'client_secret': self.api_secret
+            }
+
+            try:
+                response = await get_http_client().post(self.AUTH_URL, headers=_TOKEN_REQUEST_HEADERS, data=data, timeout=10)
+                response.raise_for_status()
+                auth_data = orjson.loads(response.content)
+                access_token = auth_data['access_token']
+                # Amadeus returns expires_in in seconds
+                expires_in = auth_data.get('expires_in', 3600) # Default to 1 hour if not specified
+                ttl = expires_in - 60 # Subtract 60s buffer
+                cache_token(self.api_key, access_token, ttl)
+                await store_shared_token(self.api_key, access_token, ttl)
+                return access_token
+            except httpx.HTTPError as e:
+                logger.error("Amadeus authentication failed: %s", e)
+                raise AmadeusAuthError(f"Failed to get Amadeus access token: {e}")
+            except KeyError as e:
+                logger.error("Amadeus authentication response missing key: %s", e)
+                raise AmadeusAuthError(f"Amadeus authentication response malformed: {e}")
     
-    def get_hotels_by_city(
+    async def get_hotels_by_city(
         self,
         city_code: str,
         radius: Optional[int] = None,
         chain_codes: Optional[List[str]] = None,
         ratings: Optional[List[Literal["1", "2", "3", "4", "5"]]] = None
+    ) -> Optional[HotelListResponse]:
+        """
+        Gets a list of basic hotel information for a city.
+        Results are cached for 6 hours per normalized query.
+        """
+        cache_key = _city_hotels_cache_key(city_code, radius, chain_codes, ratings)
+        cached_hotels = await _get_cached_city_hotels(cache_key)
+        if cached_hotels is not None:
+            return cached_hotels
+
+        # a cold city is looked up once; concurrent searches for it wait for that result
+        lock = self._city_hotels_locks.get(cache_key)
+        if lock is None:
+            lock = self._city_hotels_locks[cache_key] = asyncio.Lock()
+        async with lock:
+            cached_hotels = await _get_cached_city_hotels(cache_key)
+            if cached_hotels is not None:
+                return cached_hotels
+
+            hotels = await self._fetch_hotels_by_city(city_code, radius, chain_codes, ratings)
+            if hotels:
+                await _cache_city_hotels(cache_key, hotels)
+            return hotels
+
+    async def _fetch_hotels_by_city(
+        self,
+        city_code: str,
+        radius: Optional[int],
+        chain_codes: Optional[List[str]],
+        ratings: Optional[List[str]]
     ) -> Optional[HotelListResponse]:
         """
         Calls Amadeus Hotels by City API to get a list of basic hotel information.
         """
         try:
-            access_token = self._get_access_token()
-            headers = {
-                'Authorization': f'Bearer {access_token}'
-            }
+            headers = bearer_headers(await self._get_access_token())
 
             params = {
                 'cityCode': city_code.upper()
@@ -93,55 +155,30 @@ class HotelService:
             if ratings:
                 params['ratings'] = ','.join(ratings)
 
-            print(f"Amadeus Hotels by City URL: {self.HOTEL_BY_CITY_API_URL}?{requests.compat.urlencode(params)}")
+            logger.debug("Amadeus Hotels by City request: %s params=%s", self.HOTEL_BY_CITY_API_URL, params)
 
-            response = requests.get(self.HOTEL_BY_CITY_API_URL, headers=headers, params=params, timeout=10)
+            response = await get_http_client().get(self.HOTEL_BY_CITY_API_URL, headers=headers, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            hotels_list = _HotelsByCityPayload.model_validate_json(response.content).data
 
-            if not data.get("data"):
-                print(f"No hotels found for city: {city_code}")
+            if not hotels_list:
+                logger.info("No hotels found for city: %s", city_code)
                 return None
             
-            hotels_list: List[CityHotelInfo] = []
-            for hotel_data in data["data"]:
-                geo_code = None
-                if hotel_data.get("geoCode"):
-                    geo_code = GeoCode(
-                        latitude=hotel_data["geoCode"]["latitude"],
-                        longitude=hotel_data["geoCode"]["longitude"]
-                    )
-                distance = None
-                if hotel_data.get("distance"):
-                    distance = Distance(
-                        value=hotel_data["distance"]["value"],
-                        unit=hotel_data["distance"]["unit"],
-                    )
-                country_code = hotel_data.get("address", {}).get("countryCode")
-
-                hotels_list.append(CityHotelInfo(
-                    hotel_id=hotel_data["hotelId"],
-                    name=hotel_data["name"],
-                    chain_code=hotel_data.get("chainCode"),
-                    iata_code=hotel_data.get("iataCode"),
-                    geo_code=geo_code,
-                    country_code=country_code,
-                    distance=distance
-                ))
             return HotelListResponse(hotels=hotels_list)
         except AmadeusAuthError:
             raise # Re-raise auth errors immediately
-        except requests.exceptions.RequestException as e:
-            print(f"Amadeus 'Hotels by City' API call failed for {city_code}: {e}")
+        except httpx.HTTPError as e:
+            logger.warning("Amadeus 'Hotels by City' API call failed for %s: %s", city_code, e)
             return None
-        except (KeyError, TypeError) as e:
-            print(f"Error parsing Amadeus 'Hotels by City' response: {e}")
+        except (KeyError, TypeError, ValidationError) as e:
+            logger.exception("Error parsing Amadeus 'Hotels by City' response: %s", e)
             return None
         except Exception as e:
-            print(f"An unexpected error occurred in Amadeus Hotels_by_city: {e}")
+            logger.exception("An unexpected error occurred in Amadeus Hotels_by_city: %s", e)
             return None
         
-    def get_hotel_offers(
+    async def get_hotel_offers(
         self,
         hotel_ids: List[str],
         check_in_date: date,
@@ -157,16 +194,11 @@ class HotelService:
         This API returns offers per hotel ID.
         """
         if not hotel_ids:
-            print("No hotel IDs provided for offers search.")
+            logger.debug("No hotel IDs provided for offers search.")
             return []
 
-        all_offers_responses: List[HotelOffersResponse] = []
-
         try:
-            access_token = self._get_access_token()
-            headers = {
-                'Authorization': f'Bearer {access_token}'
-            }
+            headers = bearer_headers(await self._get_access_token())
 
             params = {
                 'hotelIds': ','.join(hotel_ids),
@@ -185,90 +217,34 @@ class HotelService:
             
             ## add mappings for amenities later
 
-            print(f"Amadeus Hotel Offers URL: {self.HOTEL_OFFERS_API_URL}?{requests.compat.urlencode(params)}")
+            logger.debug("Amadeus Hotel Offers request: %s params=%s", self.HOTEL_OFFERS_API_URL, params)
 
-            response = requests.get(self.HOTEL_OFFERS_API_URL, headers=headers, params=params)
+            async with self._offers_semaphore:
+                response = await get_http_client().get(self.HOTEL_OFFERS_API_URL, headers=headers, params=params, timeout=15)
             response.raise_for_status()
-            data = response.json()
+            # ISO date strings are parsed by pydantic-core's native date validator
+            all_offers_responses = _HotelOffersPayload.model_validate_json(response.content).data
 
-            if not data.get("data"):
-                print(f"No offers found for hotel IDs: {', '.join(hotel_ids)}")
+            if not all_offers_responses:
+                logger.info("No offers found for hotel IDs: %s", hotel_ids)
                 return None
             
-            for hotel_offer_entry in data["data"]:
-                hotel_info = DetailedHotelInfo(
-                    hotel_id=hotel_offer_entry["hotel"]["hotelId"],
-                    name=hotel_offer_entry["hotel"]["name"],
-                    chain_code=hotel_offer_entry["hotel"].get("chainCode"),
-                    city_code=hotel_offer_entry["hotel"].get("cityCode"),
-                    latitude=hotel_offer_entry["hotel"].get("latitude"),
-                    longitude=hotel_offer_entry["hotel"].get("longitude")
-                )
-
-                offers_list: List[HotelOfferDetails] = []
-                for offer_data in hotel_offer_entry.get("offers", []):
-                    room_info = None
-                    if offer_data.get("room"):
-                        room_info = RoomInfo(
-                            type=offer_data["room"].get("type"),
-                            type_estimated=RoomTypeEstimated(
-                                category=offer_data["room"]["typeEstimated"].get("category"),
-                                beds=offer_data["room"]["typeEstimated"].get("beds"),
-                                bed_type=offer_data["room"]["typeEstimated"].get("bedType")
-                            ) if offer_data["room"].get("typeEstimated") else None,
-                            description=RoomDescription(
-                                text=offer_data["room"]["description"].get("text"),
-                                lang=offer_data["room"]["description"].get("lang")
-                            ) if offer_data["room"].get("description") else None
-                        )
-
-                    guest_info = GuestInfo(adults=offer_data["guests"]["adults"])
-                    
-                    price_info = OfferPrice(
-                        currency=offer_data["price"]["currency"],
-                        total =float(offer_data["price"]["total"]),
-                        base=float(offer_data["price"]["base"]) if offer_data["price"].get("base") 
-                            else None
-                    )
-
-                    cancellation_policy = None
-                    if offer_data.get("policies", {}).get("cancellation"):
-                        cancellation_policy = CancellationPolicy(
-                            type=offer_data["policies"]["cancellation"].get("type"),
-                            description_text=offer_data["policies"]["cancellation"]["description"].get("text")
-                        )
-
-                    offers_list.append(HotelOfferDetails(
-                        offer_id=offer_data["id"],
-                        check_in_date=date.fromisoformat(offer_data["checkInDate"]),
-                        check_out_date=date.fromisoformat(offer_data["checkOutDate"]),
-                        guests=guest_info,
-                        price=price_info,
-                        room=room_info,
-                        available=offer_data.get("available"),
-                        payment_type=offer_data.get("policies", {}).get("paymentType"),
-                        cancellation_policy=cancellation_policy
-                    ))
-                all_offers_responses.append(HotelOffersResponse(
-                    hotel=hotel_info,
-                    offers=offers_list
-                ))
             return all_offers_responses
     
         except AmadeusAuthError:
             raise
-        except requests.exceptions.RequestException as e:
-            print(f"Amadeus 'Hotel Offers' API call failed for {hotel_ids}: {e}")
+        except httpx.HTTPError as e:
+            logger.warning("Amadeus 'Hotel Offers' API call failed for %s: %s", hotel_ids, e)
             return None
-        except (KeyError, TypeError) as e:
-            print(f"Error parsing Amadeus 'Hotel Offers' response: {e}")
+        except (KeyError, TypeError, ValidationError) as e:
+            logger.exception("Error parsing Amadeus 'Hotel Offers' response: %s", e)
             return None
         except Exception as e:
-            print(f"An unexpected error occurred in get_hotel_offers: {e}")
+            logger.exception("An unexpected error occurred in get_hotel_offers: %s", e)
             return None
         
 
-    def find_hotels_with_offers(
+    async def find_hotels_with_offers(
         self,
         city_code: str,
         check_in_date: date,
@@ -287,10 +263,12 @@ class HotelService:
         Consolidated method to first search for hotels by city, then get their offers.
         Returns a list of HotelOffersResponse for each hotel found.
         """
-        print(f"Searching for hotels in {city_code} from {check_in_date} to {check_out_date} for {num_adults} adults.")
+        logger.info(
+            "Searching for hotels in %s from %s to %s for %s adults.", city_code, check_in_date, check_out_date, num_adults
+        )
 
         # Step 1: Search for hotels by city
-        city_hotels_response = self.get_hotels_by_city(
+        city_hotels_response = await self.get_hotels_by_city(
             city_code=city_code,
             radius=radius,
             chain_codes=chain_codes,
@@ -298,35 +276,81 @@ class HotelService:
         )    
 
         if not city_hotels_response or not city_hotels_response.hotels:
-            print(f"No hotels found in {city_code} for the initial search.")
+            logger.info("No hotels found in %s for the initial search.", city_code)
             return []
 
         hotel_ids_for_offers = [
             hotel.hotel_id for hotel in city_hotels_response.hotels[:max_hotels_to_search]
         ]
         if not hotel_ids_for_offers:
-            print("No hotel IDs available after initial city search.")
+            logger.info("No hotel IDs available after initial city search.")
             return []
         
-        print(f"Found {len(hotel_ids_for_offers)} hotels. Fetching offers for these hotels...")
-
-
-        # Step 2: Get offers for the found hotel IDs
-        hotel_offers_responses = self.get_hotel_offers(
-            hotel_ids=hotel_ids_for_offers,
-            check_in_date=check_in_date,
-            check_out_date=check_out_date,
-            num_adults=num_adults,
-            num_rooms=num_rooms,
-            currency=currency,
-            price_range=price_range,
-            best_rate_only=best_rate_only
-        )
+        logger.debug("Found %d hotels. Fetching offers for these hotels...", len(hotel_ids_for_offers))
+
+
+        # Step 2: Get offers for the found hotel IDs, one request per hotel so a single
+        # failing ID doesn't wipe out the offers of the others
+        results = await asyncio.gather(*(
+            self.get_hotel_offers(
+                hotel_ids=[hotel_id],
+                check_in_date=check_in_date,
+                check_out_date=check_out_date,
+                num_adults=num_adults,
+                num_rooms=num_rooms,
+                currency=currency,
+                price_range=price_range,
+                best_rate_only=best_rate_only
+            )
+            for hotel_id in hotel_ids_for_offers
+        ), return_exceptions=True)
+
+        hotel_offers_responses: List[HotelOffersResponse] = []
+        for hotel_id, result in zip(hotel_ids_for_offers, results):
+            if isinstance(result, Exception):
+                logger.warning("Offers lookup failed for hotel %s: %s", hotel_id, result)
+            elif result:
+                hotel_offers_responses.extend(result)
 
         if not hotel_offers_responses:
-            print("No offers found for the selected hotels")
+            logger.info("No offers found for the selected hotels")
             return []
         
         return hotel_offers_responses
     
+def _city_hotels_cache_key(
+    city_code: str,
+    radius: Optional[int],
+    chain_codes: Optional[List[str]],
+    ratings: Optional[List[str]]
+) -> str:
+    """Cache key for a normalized hotels-by-city query"""
+    chains = ','.join(sorted(chain_codes or ()))
+    stars = ','.join(sorted(ratings or ()))
+    return f"hotels:by-city:{city_code.upper()}:{radius}:{chains}:{stars}"
+
+async def _get_cached_city_hotels(cache_key: str) -> Optional[HotelListResponse]:
+    """Cached hotels for a city query, or None on a miss"""
+    redis_client = get_redis_client()
+    if redis_client is None:
+        return _city_hotels_cache.get(cache_key)
+    try:
+        raw_hotels = await redis_client.get(cache_key)
+        if raw_hotels:
+            return HotelListResponse.model_validate_json(raw_hotels)
+    except redis.RedisError as e:
+        logger.warning("Hotels by city cache read failed: %s", e)
+    return None
+
+async def _cache_city_hotels(cache_key: str, hotels: HotelListResponse) -> None:
+    """Store hotels for a city query (best effort)"""
+    redis_client = get_redis_client()
+    if redis_client is None:
+        _city_hotels_cache[cache_key] = hotels
+        return
+    try:
+        await redis_client.set(cache_key, hotels.model_dump_json(), ex=_CITY_HOTELS_CACHE_TTL_SECONDS)
+    except redis.RedisError as e:
+        logger.warning("Hotels by city cache write failed: %s", e)
+
 hotel_service = HotelService()
\ No newline at end of file
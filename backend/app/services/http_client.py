@@ -0,0 +1,32 @@
+import logging
+from typing import Optional
+import httpx
+
+logger = logging.getLogger(__name__)
+
+### Dependency injection
+
+# Singleton instance
+_http_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Shared AsyncClient for outbound API calls.
+    Reusing one client keeps connections (and TLS sessions) pooled across requests.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=10,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100)
+        )
+    return _http_client
+
+async def close_http_client() -> None:
+    """Close the shared client on application shutdown"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        logger.info("Shared HTTP client closed")
@@ -1,34 +1,59 @@
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
 from app.core.config import settings
-from jose import JWTError, jwt
+from cachetools import TLRUCache
+import jwt
 from typing import Union, Optional
 
+# Built once rather than on every sign/verify
+_JWT_KEY = settings.JWT_SECRET_KEY.encode()
+_JWT_ALGORITHMS = [settings.JWT_ALGORITHM]
+_ACCESS_TTL = timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
+_REFRESH_TTL = timedelta(days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS)
+
+# Verified payloads by token hash, each kept until the token's own exp (15 minutes at most),
+# so repeated checks of the same token skip signature verification. Per process only;
+# logout is still enforced by AuthService's blacklist check, which does not go through here.
+_VERIFIED_TOKEN_MAX_AGE_SECONDS = 900
+_verified_tokens: TLRUCache = TLRUCache(
+    maxsize=10_000,
+    ttu=lambda _hash, payload, now: min(payload.get("exp", now), now + _VERIFIED_TOKEN_MAX_AGE_SECONDS),
+    timer=time.time
+)
+
 
 class JWTService:
     """JWT service to handle creation and verification of jwt tokens"""
     @staticmethod
     def create_access_token(data: dict, expires_delta: Union[timedelta, None] = None) -> str:
         to_encode = data.copy()
-        expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES))
+        expire = datetime.now(timezone.utc) + (expires_delta or _ACCESS_TTL)
         to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+        encoded_jwt = jwt.encode(to_encode, _JWT_KEY, algorithm=settings.JWT_ALGORITHM)
         return encoded_jwt
     
     @staticmethod
     def create_refresh_token(data: dict) -> str:
         to_encode = data.copy()
-        expire = datetime.now(timezone.utc) + timedelta(days = settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS)
+        expire = datetime.now(timezone.utc) + _REFRESH_TTL
         to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+        encoded_jwt = jwt.encode(to_encode, _JWT_KEY, algorithm=settings.JWT_ALGORITHM)
         return encoded_jwt
     
     @staticmethod
     def verify_token(token: str) -> Optional[dict]:
-        try:
-            payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+        token_hash = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        payload = _verified_tokens.get(token_hash)
+        if payload is not None:
             return payload
-        except JWTError:
+
+        try:
+            payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
+        except jwt.PyJWTError:
             return None
+        _verified_tokens[token_hash] = payload
+        return payload
     
     @staticmethod
     def verify_access_token(token: str) -> Optional[dict]:
@@ -38,8 +63,4 @@ class JWTService:
     @staticmethod
     def verify_refresh_token(token: str) -> Optional[dict]:
         """Verify refresh token - currently same as access token verification"""
-        try:
-            payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
-            return payload
-        except JWTError:
-            return None
+        return JWTService.verify_token(token)
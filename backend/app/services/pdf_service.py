@@ -1,3 +1,4 @@
+import asyncio
 import io
 import uuid
 from datetime import datetime, date
@@ -217,16 +218,16 @@ class PDFService:
             
             # Upload to Firebase Storage
             blob = self.bucket.blob(unique_filename)
-            blob.upload_from_string(pdf_bytes, content_type='application/pdf')
+            await asyncio.to_thread(blob.upload_from_string, pdf_bytes, content_type='application/pdf')
             
             try:
-                blob.make_public()
+                await asyncio.to_thread(blob.make_public)
                 public_url = blob.public_url
             except Exception as e:
                 logger.warning(
                     "Could not make blob public, falling back to signed URL: %s", e
                 )
-                public_url = blob.generate_signed_url(expiration=timedelta(days=7))
+                public_url = await asyncio.to_thread(blob.generate_signed_url, expiration=timedelta(days=7))
             logger.info(f"PDF uploaded successfully: {unique_filename}")
             
             return public_url
@@ -240,7 +241,7 @@ class PDFService:
             # Extract filename from URL
             filename = pdf_url.split('/')[-1].split('?')[0]  # Remove query params
             blob = self.bucket.blob(f"itineraries/{filename}")
-            blob.delete()
+            await asyncio.to_thread(blob.delete)
             logger.info(f"PDF deleted successfully: {filename}")
             return True
         except Exception as e:
@@ -262,8 +263,9 @@ class PDFService:
         try:
             logger.info("Starting PDF creation process...")
             
-            # Generate PDF
-            pdf_bytes = self.create_itinerary_pdf(
+            # Generate PDF (CPU-bound reportlab work, keep it off the event loop)
+            pdf_bytes = await asyncio.to_thread(
+                self.create_itinerary_pdf,
                 trip_summary, user_name, destination, start_date, end_date,
                 flights, hotels, daily_plans
             )
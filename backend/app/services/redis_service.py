@@ -0,0 +1,30 @@
+import logging
+from typing import Optional
+import redis.asyncio as redis
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+### Dependency injection
+
+# Singleton instance
+_redis_client: Optional[redis.Redis] = None
+
+def get_redis_client() -> Optional[redis.Redis]:
+    """
+    Shared async Redis client, or None when REDIS_URL is not configured.
+    Callers fall back to in-process state when this returns None.
+    """
+    global _redis_client
+    if _redis_client is None and settings.REDIS_URL:
+        _redis_client = redis.from_url(settings.REDIS_URL)
+        logger.info("Redis client initialized")
+    return _redis_client
+
+async def close_redis_client() -> None:
+    """Close the shared client's connection pool on application shutdown"""
+    global _redis_client
+    if _redis_client is not None:
+        await _redis_client.aclose()
+        _redis_client = None
+        logger.info("Redis client closed")
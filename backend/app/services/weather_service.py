@@ -1,8 +1,15 @@
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional, Dict, List
 from datetime import datetime
 from urllib.parse import quote
+from pydantic import TypeAdapter
 from app.core.config import settings
+from app.schemas.weather_schemas import RawWeatherValues, WeatherSignals
+
+# Signals and raw values are built from Tomorrow.io data, so they are validated on the way in
+_weather_signals_adapter = TypeAdapter(WeatherSignals)
+_raw_weather_adapter = TypeAdapter(RawWeatherValues)
 
 class WeatherService:
     """
@@ -10,6 +17,12 @@ class WeatherService:
     """
     BASE_URL = f"https://api.tomorrow.io/v4/weather/forecast?apikey={settings.TomorrowIO_API_KEY}"
 
+    def __init__(self):
+        # pooled session keeps the TLS connection to Tomorrow.io alive between forecasts
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        self._session.mount("https://", adapter)
+
     def get_weather_forecast(self, city: str, timesteps: str) -> Optional[Dict]:
         """
         Fetches the weather forecast of a target city within the next 5 days.
@@ -27,7 +40,7 @@ class WeatherService:
         try:
             encoded_city = quote(city)
             url = f"{self.BASE_URL}&location={encoded_city}&timesteps={timesteps}"
-            response = requests.get(url, timeout=5)
+            response = self._session.get(url, timeout=5)
             response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
             data = response.json()
 
@@ -116,7 +129,7 @@ class WeatherService:
             weather_data (dict): Raw weather values from API.
 
         Returns:
-            dict: {"signals": {...}, "raw": {...}}
+            dict: {"signals": WeatherSignals, "raw": RawWeatherValues}
         """
         def label_temp(celsius):
             if celsius is None: return "unavailable"
@@ -178,8 +191,8 @@ class WeatherService:
         }
 
         return {
-            "signals": signals,
-            "raw": raw
+            "signals": _weather_signals_adapter.validate_python(signals),
+            "raw": _raw_weather_adapter.validate_python(raw)
         }
 
 weather_service = WeatherService()
\ No newline at end of file
@@ -0,0 +1,41 @@
+import os
+import sys
+import orjson
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+# Settings are read when app modules are imported, so dummy credentials have to be
+# in place first. The Firebase Admin SDK parses the service account key on startup
+# but makes no network calls until a request is sent.
+_private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048).private_bytes(
+    serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+).decode()
+
+_TEST_ENV = {
+    "ExchangeRate_API_KEY": "test",
+    "TomorrowIO_API_KEY": "test",
+    "AMADEUS_API_KEY": "test",
+    "AMADEUS_API_SECRET": "test",
+    "GEMINI_API_KEY": "test",
+    "FIREBASE_SERVICE_ACCOUNT_KEY": orjson.dumps({
+        "type": "service_account",
+        "project_id": "route-rishi-test",
+        "private_key_id": "test",
+        "private_key": _private_key,
+        "client_email": "test@route-rishi-test.iam.gserviceaccount.com",
+        "client_id": "0",
+        "token_uri": "https://oauth2.googleapis.com/token",
+    }).decode(),
+    "FIREBASE_WEB_API_KEY": "test",
+    "FIREBASE_STORAGE_BUCKET": "route-rishi-test.appspot.com",
+    "JWT_SECRET_KEY": "test-secret",
+    "GOOGLE_CLIENT_ID": "test",
+    "GOOGLE_CLIENT_SECRET": "test",
+}
+for _name, _value in _TEST_ENV.items():
+    os.environ.setdefault(_name, _value)
+
+# unit tests run against the in-process stores, never a real Redis
+os.environ.pop("REDIS_URL", None)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -13,7 +13,7 @@ async def test_services_directly():
         weather_data = weather_service.get_weather_forecast("New York", "1d")
         print(f"Weather Service Response: {weather_data}")
         if weather_data:
-            print(f"Weather for {weather_data['city']} on {weather_data['forecast_date']}: {weather_data['signals']['temp_avg']}, {weather_data['signals']['cloud_cover']}")
+            print(f"Weather for {weather_data['city']} on {weather_data['forecast_date']}: {weather_data['signals'].temp_avg}, {weather_data['signals'].cloud_cover}")
         else:
             print("Weather service returned None.")
     except Exception as e:
@@ -21,7 +21,7 @@ async def test_services_directly():
 
     print("\n--- Testing Currency Service Directly ---")
     try:
-        currency_rate = currency_service.get_exchange_rate_to_usd("JPY")
+        currency_rate = await currency_service.get_exchange_rate_to_usd("JPY")
         print(f"Currency Service Response: {currency_rate}")
         if currency_rate:
             print(f"1 USD = {currency_rate} JPY")
@@ -34,7 +34,7 @@ async def test_services_directly():
     try:
         departure_date_test = date.today() + timedelta(days=30)
         return_date_test = date.today() + timedelta(days=35)
-        flights_data = flight_service.search_flight_offers(
+        flights_data = await flight_service.search_flight_offers(
             origin_code="SFO",
             destination_code="LAX",
             departure_date=departure_date_test,
@@ -54,7 +54,7 @@ async def test_services_directly():
     try:
         check_in_date_test = date.today() + timedelta(days=60)
         check_out_date_test = date.today() + timedelta(days=65)
-        hotels_data = hotel_service.find_hotels_with_offers(
+        hotels_data = await hotel_service.find_hotels_with_offers(
             city_code="ROM",
             check_in_date=check_in_date_test,
             check_out_date=check_out_date_test,
@@ -0,0 +1,80 @@
+import time
+
+import pytest
+
+from app.services import auth_service
+from app.services.auth_service import AuthService, OAuthState
+from app.services.jwt_service import JWTService
+
+
+@pytest.fixture
+def auth():
+    """AuthService on the in-process blacklist and OAuth state stores, emptied around each test"""
+    service = AuthService(None, JWTService())
+    service.redis = None
+    _clear_stores()
+    yield service
+    _clear_stores()
+
+
+def _clear_stores():
+    auth_service._blacklisted_hashes.clear()
+    auth_service._blacklist_heap.clear()
+    auth_service._oauth_states.clear()
+
+
+@pytest.mark.asyncio
+async def test_blacklisted_token_is_rejected_until_swept(auth):
+    token_hash = AuthService._hash_token("access-token")
+
+    await auth._blacklist_token(token_hash, time.time() + 60)
+
+    assert await auth._is_token_blacklisted(token_hash)
+    assert not await auth._is_token_blacklisted(AuthService._hash_token("other-token"))
+
+
+@pytest.mark.asyncio
+async def test_cleanup_drops_only_expired_tokens(auth):
+    expired_hash = AuthService._hash_token("expired-token")
+    live_hash = AuthService._hash_token("live-token")
+    await auth._blacklist_token(live_hash, time.time() + 60)
+    await auth._blacklist_token(expired_hash, time.time() - 1)
+
+    AuthService._cleanup_expired_tokens()
+
+    assert not await auth._is_token_blacklisted(expired_hash)
+    assert await auth._is_token_blacklisted(live_hash)
+    assert [token_hash for _, token_hash in auth_service._blacklist_heap] == [live_hash]
+
+
+@pytest.mark.asyncio
+async def test_blacklisting_a_token_twice_keeps_one_entry(auth):
+    token_hash = AuthService._hash_token("access-token")
+
+    await auth._blacklist_token(token_hash, time.time() + 60)
+    await auth._blacklist_token(token_hash, time.time() + 60)
+
+    assert len(auth_service._blacklist_heap) == 1
+
+
+@pytest.mark.asyncio
+async def test_oauth_state_can_only_be_used_once(auth):
+    state = OAuthState(flow_type="login", timestamp=time.time(), ip="127.0.0.1")
+
+    await auth._store_oauth_state("state-1", state)
+
+    assert await auth._pop_oauth_state("state-1") == state
+    assert await auth._pop_oauth_state("state-1") is None
+
+
+@pytest.mark.asyncio
+async def test_storing_oauth_state_drops_expired_states(auth):
+    now = time.time()
+    expired_at = now - auth_service._OAUTH_STATE_TTL_SECONDS - 1
+    await auth._store_oauth_state("expired", OAuthState(flow_type="login", timestamp=expired_at, ip="127.0.0.1"))
+    await auth._store_oauth_state("recent", OAuthState(flow_type="signup", timestamp=now - 5, ip="127.0.0.1"))
+
+    await auth._store_oauth_state("new", OAuthState(flow_type="login", timestamp=now, ip="127.0.0.1"))
+
+    assert list(auth_service._oauth_states) == ["recent", "new"]
+    assert await auth._pop_oauth_state("expired") is None
@@ -0,0 +1,101 @@
+import time
+
+import pytest
+
+from app.services import auth_service, redis_service
+from app.services.auth_service import AuthService
+from app.services.jwt_service import JWTService
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio commands AuthService uses"""
+
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+
+    async def setex(self, key, ttl, value):
+        self.values[key] = value
+        self.ttls[key] = ttl
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+        self.ttls[key] = ex
+
+    async def exists(self, key):
+        return int(key in self.values)
+
+    async def getdel(self, key):
+        self.ttls.pop(key, None)
+        return self.values.pop(key, None)
+
+
+@pytest.fixture
+def redis_auth():
+    service = AuthService(None, JWTService())
+    service.redis = FakeRedis()
+    auth_service._blacklisted_hashes.clear()
+    auth_service._blacklist_heap.clear()
+    yield service
+    auth_service._blacklisted_hashes.clear()
+    auth_service._blacklist_heap.clear()
+
+
+@pytest.mark.asyncio
+async def test_blacklist_is_kept_in_redis_until_the_token_expires(redis_auth):
+    token_hash = AuthService._hash_token("access-token")
+
+    await redis_auth._blacklist_token(token_hash, time.time() + 120)
+
+    key = f"bl:{token_hash.hex()}"
+    assert key in redis_auth.redis.values
+    assert 118 <= redis_auth.redis.ttls[key] <= 120
+    assert await redis_auth._is_token_blacklisted(token_hash)
+    # nothing goes to the in-process blacklist when Redis is configured
+    assert not auth_service._blacklisted_hashes
+
+
+@pytest.mark.asyncio
+async def test_already_expired_token_still_gets_a_positive_ttl(redis_auth):
+    token_hash = AuthService._hash_token("expired-token")
+
+    await redis_auth._blacklist_token(token_hash, time.time() - 10)
+
+    assert redis_auth.redis.ttls[f"bl:{token_hash.hex()}"] == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_token_is_not_blacklisted_in_redis(redis_auth):
+    assert not await redis_auth._is_token_blacklisted(AuthService._hash_token("other-token"))
+
+
+@pytest.mark.asyncio
+async def test_close_redis_client_releases_the_shared_client(monkeypatch):
+    monkeypatch.setattr(redis_service.settings, "REDIS_URL", "redis://localhost:6379/0")
+    monkeypatch.setattr(redis_service, "_redis_client", None)
+
+    client = redis_service.get_redis_client()
+    assert client is redis_service.get_redis_client()
+
+    await redis_service.close_redis_client()
+
+    assert redis_service._redis_client is None
+    monkeypatch.setattr(redis_service.settings, "REDIS_URL", None)
+    assert redis_service.get_redis_client() is None
+
+
+@pytest.mark.asyncio
+async def test_oauth_state_round_trips_through_redis_once(redis_auth):
+    state = auth_service.OAuthState(flow_type="signup", timestamp=time.time(), ip="127.0.0.1")
+
+    await redis_auth._store_oauth_state("state-1", state)
+
+    assert redis_auth.redis.ttls["oauth:state:state-1"] == auth_service._OAUTH_STATE_TTL_SECONDS
+    assert not auth_service._oauth_states
+    assert await redis_auth._pop_oauth_state("state-1") == state
+    assert await redis_auth._pop_oauth_state("state-1") is None
+
+
+@pytest.mark.asyncio
+async def test_unknown_oauth_state_is_none_in_redis(redis_auth):
+    assert await redis_auth._pop_oauth_state("never-issued") is None
@@ -0,0 +1,118 @@
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import app
+from app.api.v1.endpoints import conversations
+from app.middleware.auth_middleware import get_current_user_required
+from app.schemas.auth_schemas import UserResponse
+from app.schemas.chat_schemas import ChatMessage
+from app.schemas.conversation_schemas import ConversationMetadata
+from app.services.firestore_service import InvalidCursorError
+
+USER = UserResponse(id="user-1", email="user@example.com", fullName="Test User", provider="email")
+NOW = datetime(2025, 7, 1, tzinfo=timezone.utc)
+
+
+class FakeFirestoreService:
+    """Yields the given items, then optionally fails the way a mid-stream Firestore error would"""
+
+    def __init__(self, items, error=None, owns=True):
+        self.items = items
+        self.error = error
+        self.owns = owns
+
+    async def _stream(self):
+        for item in self.items:
+            yield item
+        if self.error:
+            raise self.error
+
+    def get_user_conversations(self, user_id, page, page_size, start_after):
+        return self._stream()
+
+    def get_messages(self, conversation_id, page, page_size, order, start_after):
+        return self._stream()
+
+    async def user_owns_conversation(self, user_id, conversation_id):
+        return self.owns
+
+
+@pytest.fixture
+def client():
+    app.dependency_overrides[get_current_user_required] = lambda: USER
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _use(monkeypatch, service):
+    monkeypatch.setattr(conversations, "get_firestore_service", lambda: service)
+
+
+def _conversation(conversation_id):
+    return ConversationMetadata.model_construct(
+        id=conversation_id, title="Trip", created_at=NOW, updated_at=NOW,
+        user_id=USER.id, message_count=2, is_guest=False,
+    )
+
+
+def _message(message_id):
+    return ChatMessage.model_construct(
+        id=message_id, role="user", content="hi", timestamp=NOW, conversation_id="conv-1",
+        tool_calls=None, execution_time_ms=None,
+    )
+
+
+def test_conversations_page_is_returned_as_json_list(client, monkeypatch):
+    _use(monkeypatch, FakeFirestoreService([_conversation("conv-1"), _conversation("conv-2")]))
+
+    response = client.get("/api/v1/conversations/")
+
+    assert response.status_code == 200
+    assert [c["id"] for c in response.json()] == ["conv-1", "conv-2"]
+
+
+def test_conversations_error_after_first_document_is_a_500(client, monkeypatch):
+    _use(monkeypatch, FakeFirestoreService([_conversation("conv-1")], error=RuntimeError("deadline exceeded")))
+
+    response = client.get("/api/v1/conversations/")
+
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Failed to retrieve conversations"}
+
+
+def test_messages_error_after_first_document_is_a_500(client, monkeypatch):
+    _use(monkeypatch, FakeFirestoreService([_message("m-1")], error=RuntimeError("deadline exceeded")))
+
+    response = client.get("/api/v1/conversations/conv-1/messages")
+
+    assert response.status_code == 500
+
+
+def test_messages_page_goes_through_response_model(client, monkeypatch):
+    _use(monkeypatch, FakeFirestoreService([_message("m-1"), _message("m-2")]))
+
+    response = client.get("/api/v1/conversations/conv-1/messages")
+
+    assert response.status_code == 200
+    assert [m["id"] for m in response.json()] == ["m-1", "m-2"]
+    assert response.json()[0]["timestamp"] == "2025-07-01T00:00:00Z"
+
+
+def test_messages_of_someone_elses_conversation_are_not_found(client, monkeypatch):
+    _use(monkeypatch, FakeFirestoreService([_message("m-1")], owns=False))
+
+    response = client.get("/api/v1/conversations/conv-1/messages")
+
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize("path", ["/api/v1/conversations/", "/api/v1/conversations/conv-1/messages"])
+def test_invalid_cursor_is_a_400(client, monkeypatch, path):
+    _use(monkeypatch, FakeFirestoreService([], error=InvalidCursorError("Invalid start_after cursor: gone")))
+
+    response = client.get(path, params={"start_after": "gone"})
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid start_after cursor"}
@@ -0,0 +1,241 @@
+import pytest
+
+from app.services import firestore_service
+from app.services.firestore_service import FirestoreService
+
+
+class FakeRef:
+    def __init__(self, path):
+        self.id = path.rsplit("/", 1)[-1]
+        self.path = path
+
+    def __repr__(self):
+        return f"FakeRef({self.path!r})"
+
+
+class FakeBulkWriter:
+    def __init__(self, deleted):
+        self.deleted = deleted
+        self.closed = False
+
+    def delete(self, ref):
+        self.deleted.append(ref)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSyncClient:
+    def __init__(self):
+        self.deleted = []
+        self.writers = []
+
+    def bulk_writer(self):
+        writer = FakeBulkWriter(self.deleted)
+        self.writers.append(writer)
+        return writer
+
+
+class FakeBatch:
+    def __init__(self, db):
+        self.db = db
+        self.refs = []
+
+    def delete(self, ref):
+        self.refs.append(ref)
+
+    async def commit(self):
+        self.db.committed_batches.append(self.refs)
+
+
+class FakeMessages:
+    def __init__(self, conversation_id, count):
+        self.refs = [FakeRef(f"conversations/{conversation_id}/messages/m{i}") for i in range(count)]
+
+    async def list_documents(self, page_size=None):
+        for ref in self.refs:
+            yield ref
+
+
+class FakeConversationRef(FakeRef):
+    def __init__(self, conversation_id, message_count):
+        super().__init__(f"conversations/{conversation_id}")
+        self.messages = FakeMessages(conversation_id, message_count)
+
+    def collection(self, name):
+        assert name == "messages"
+        return self.messages
+
+
+class FakeAsyncClient:
+    """Async client whose bulk_writer() must not be used: it would build a new sync client"""
+
+    def __init__(self, message_count):
+        self.message_count = message_count
+        self.committed_batches = []
+
+    def collection(self, name):
+        assert name == "conversations"
+        return self
+
+    def document(self, conversation_id):
+        return FakeConversationRef(conversation_id, self.message_count)
+
+    def batch(self):
+        return FakeBatch(self)
+
+    def bulk_writer(self):
+        raise AssertionError("bulk deletes must reuse the instance's sync client")
+
+
+def _service(message_count=0):
+    service = FirestoreService.__new__(FirestoreService)
+    service.db = FakeAsyncClient(message_count)
+    service._sync_db = FakeSyncClient()
+    return service
+
+
+def test_bulk_delete_reuses_one_sync_client():
+    service = _service()
+    first = [FakeRef("conversations/a"), FakeRef("conversations/b")]
+    second = [FakeRef("conversations/c")]
+
+    service._bulk_delete(first)
+    service._bulk_delete(second)
+
+    assert service._sync_db.deleted == first + second
+    assert len(service._sync_db.writers) == 2
+    assert all(writer.closed for writer in service._sync_db.writers)
+
+
+@pytest.mark.asyncio
+async def test_small_conversation_is_deleted_in_one_batch():
+    service = _service(message_count=3)
+    firestore_service._conversation_cache["conv-1"] = object()
+
+    assert await service.delete_conversation("conv-1")
+
+    assert [ref.id for ref in service.db.committed_batches[0]] == ["m0", "m1", "m2", "conv-1"]
+    assert not service._sync_db.deleted
+    assert "conv-1" not in firestore_service._conversation_cache
+
+
+@pytest.mark.asyncio
+async def test_conversation_past_the_batch_limit_goes_through_bulk_writer():
+    service = _service(message_count=firestore_service._BATCH_WRITE_LIMIT)
+
+    assert await service.delete_conversation("conv-1")
+
+    assert not service.db.committed_batches
+    assert len(service._sync_db.deleted) == firestore_service._BATCH_WRITE_LIMIT + 1
+    assert service._sync_db.deleted[-1].id == "conv-1"
+
+
+class FakeSnapshot:
+    def __init__(self, ref):
+        self.reference = ref
+
+
+class FakeQuery:
+    """Chainable query stand-in; stream() is supplied per test"""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self.filters = []
+        self.cursor = None
+
+    def where(self, filter):
+        self.filters.append(filter)
+        return self
+
+    def order_by(self, *args, **kwargs):
+        return self
+
+    def select(self, field_paths):
+        return self
+
+    def limit(self, count):
+        return self
+
+    def start_after(self, snapshot):
+        page = FakeQuery(self._stream)
+        page.filters = self.filters
+        page.cursor = snapshot
+        return page
+
+    async def stream(self):
+        for snapshot in self._stream(self):
+            yield snapshot
+
+
+class FakeCleanupClient:
+    def __init__(self, guest_count, messages_per_conversation):
+        limit = firestore_service._BATCH_WRITE_LIMIT
+        refs = [FakeRef(f"conversations/guest-{i}") for i in range(guest_count)]
+        self.pages = [refs[i:i + limit] for i in range(0, len(refs), limit)]
+        self.messages_per_conversation = messages_per_conversation
+        self.message_queries = []
+
+    def _guest_page(self, query):
+        if query.cursor is None:
+            page = self.pages[0] if self.pages else []
+        else:
+            page = next(p for i, p in enumerate(self.pages) if i and self.pages[i - 1][-1] is query.cursor.reference)
+        return [FakeSnapshot(ref) for ref in page]
+
+    def _messages(self, query):
+        conversation_ids = query.filters[0].value
+        self.message_queries.append(conversation_ids)
+        return [
+            FakeSnapshot(FakeRef(f"conversations/{conv_id}/messages/m{i}"))
+            for conv_id in conversation_ids
+            for i in range(self.messages_per_conversation)
+        ]
+
+    def collection(self, name):
+        assert name == "conversations"
+        return FakeQuery(self._guest_page)
+
+    def collection_group(self, name):
+        assert name == "messages"
+        return FakeQuery(self._messages)
+
+
+def _cleanup_service(guest_count, messages_per_conversation=2):
+    service = FirestoreService.__new__(FirestoreService)
+    service.db = FakeCleanupClient(guest_count, messages_per_conversation)
+    service._sync_db = FakeSyncClient()
+    return service
+
+
+@pytest.mark.asyncio
+async def test_guest_cleanup_finds_messages_with_chunked_collection_group_queries():
+    service = _cleanup_service(guest_count=45)
+
+    assert await service.cleanup_guest_conversations(days_old=30) == 45
+
+    # 'in' filters take at most 30 values, so 45 conversations need two queries
+    assert [len(ids) for ids in service.db.message_queries] == [30, 15]
+    deleted = [ref.path for ref in service._sync_db.deleted]
+    assert len(deleted) == 45 * 2 + 45
+    assert deleted[-1] == "conversations/guest-44"
+
+
+@pytest.mark.asyncio
+async def test_guest_cleanup_pages_through_the_backlog():
+    limit = firestore_service._BATCH_WRITE_LIMIT
+    service = _cleanup_service(guest_count=limit + 3, messages_per_conversation=0)
+
+    assert await service.cleanup_guest_conversations(days_old=30) == limit + 3
+
+    # one BulkWriter per page, all on the same sync client
+    assert len(service._sync_db.writers) == 2
+    assert sum(1 for ref in service._sync_db.deleted if "/messages/" not in ref.path) == limit + 3
+
+
+@pytest.mark.asyncio
+async def test_guest_cleanup_with_nothing_to_delete():
+    service = _cleanup_service(guest_count=0)
+
+    assert await service.cleanup_guest_conversations(days_old=30) == 0
+    assert not service._sync_db.writers
@@ -0,0 +1,86 @@
+import pytest
+
+from app.services.firestore_service import FirestoreService, InvalidCursorError
+
+
+class FakeSnapshot:
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self._data = data
+        self.exists = data is not None
+
+    def to_dict(self):
+        return self._data
+
+
+class FakeDocument:
+    def __init__(self, doc_id, data):
+        self._snapshot = FakeSnapshot(doc_id, data)
+
+    async def get(self):
+        return self._snapshot
+
+
+class FakeCollection:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def document(self, doc_id):
+        return FakeDocument(doc_id, self.docs.get(doc_id))
+
+
+class FakeQuery:
+    """Records how _paginate positioned the query"""
+
+    def __init__(self):
+        self.cursor = None
+        self.skipped = 0
+
+    def start_after(self, snapshot):
+        self.cursor = snapshot.id
+        return self
+
+    def offset(self, count):
+        self.skipped = count
+        return self
+
+
+CONVERSATIONS = FakeCollection({
+    "conv-1": {"user_id": "user-1"},
+    "conv-2": {"user_id": "user-2"},
+})
+
+
+@pytest.mark.asyncio
+async def test_cursor_positions_query_after_anchor():
+    query = await FirestoreService._paginate(FakeQuery(), CONVERSATIONS, 3, 20, "conv-1", owner_id="user-1")
+
+    assert query.cursor == "conv-1"
+    assert query.skipped == 0
+
+
+@pytest.mark.asyncio
+async def test_page_falls_back_to_offset_without_cursor():
+    query = await FirestoreService._paginate(FakeQuery(), CONVERSATIONS, 3, 20, None)
+
+    assert query.cursor is None
+    assert query.skipped == 40
+
+
+@pytest.mark.asyncio
+async def test_unknown_cursor_is_rejected_instead_of_restarting():
+    with pytest.raises(InvalidCursorError):
+        await FirestoreService._paginate(FakeQuery(), CONVERSATIONS, 1, 20, "deleted-conv", owner_id="user-1")
+
+
+@pytest.mark.asyncio
+async def test_cursor_owned_by_another_user_is_rejected():
+    with pytest.raises(InvalidCursorError):
+        await FirestoreService._paginate(FakeQuery(), CONVERSATIONS, 1, 20, "conv-2", owner_id="user-1")
+
+
+@pytest.mark.asyncio
+async def test_cursor_without_owner_check_only_needs_to_exist():
+    query = await FirestoreService._paginate(FakeQuery(), CONVERSATIONS, 1, 50, "conv-2")
+
+    assert query.cursor == "conv-2"
@@ -0,0 +1,196 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.schemas.chat_schemas import ChatMessage
+from app.services import firestore_service
+from app.services.firebase_service import FirebaseService
+from app.services.firestore_service import FirestoreService
+
+NOW = datetime(2025, 7, 1, tzinfo=timezone.utc)
+
+
+class FakeSnapshot:
+    def __init__(self, data):
+        self._data = data
+        self.exists = data is not None
+
+    def to_dict(self):
+        return dict(self._data) if self._data is not None else None
+
+
+class FakeDocument:
+    """Document reference over a shared dict; usable from both the async and the sync fake"""
+
+    def __init__(self, store, path):
+        self.store = store
+        self.path = path
+
+    def collection(self, name):
+        return FakeCollection(self.store, f"{self.path}/{name}")
+
+    def _get(self, **kwargs):
+        self.store.reads += 1
+        return FakeSnapshot(self.store.docs.get(self.path))
+
+    def _set(self, data, merge=False):
+        self.store.docs[self.path] = {**self.store.docs.get(self.path, {}), **data} if merge else dict(data)
+
+    def _update(self, data):
+        self.store.docs[self.path].update(data)
+
+
+class AsyncFakeDocument(FakeDocument):
+    def collection(self, name):
+        return FakeCollection(self.store, f"{self.path}/{name}", AsyncFakeDocument)
+
+    async def get(self, **kwargs):
+        return self._get(**kwargs)
+
+    async def set(self, data, merge=False):
+        self._set(data, merge)
+
+    async def update(self, data):
+        self._update(data)
+
+
+class SyncFakeDocument(FakeDocument):
+    def get(self, **kwargs):
+        return self._get(**kwargs)
+
+    def set(self, data, merge=False):
+        self._set(data, merge)
+
+    def update(self, data):
+        self._update(data)
+
+
+class FakeCollection:
+    def __init__(self, store, path, document_cls=AsyncFakeDocument):
+        self.store = store
+        self.path = path
+        self.document_cls = document_cls
+
+    def document(self, doc_id):
+        return self.document_cls(self.store, f"{self.path}/{doc_id}")
+
+
+class FakeBatch:
+    def __init__(self):
+        self.ops = []
+
+    def set(self, ref, data):
+        self.ops.append(lambda: ref._set(data))
+
+    def update(self, ref, data):
+        self.ops.append(lambda: ref._update(data))
+
+    async def commit(self):
+        for op in self.ops:
+            op()
+
+
+class FakeStore:
+    def __init__(self):
+        self.docs = {}
+        self.reads = 0
+
+    def collection(self, name, document_cls=AsyncFakeDocument):
+        return FakeCollection(self, name, document_cls)
+
+    def batch(self):
+        return FakeBatch()
+
+
+class SyncFakeDb:
+    def __init__(self, store):
+        self.store = store
+
+    def collection(self, name):
+        return self.store.collection(name, SyncFakeDocument)
+
+
+@pytest.fixture
+def store():
+    firestore_service._conversation_cache.clear()
+    firestore_service._user_profile_cache.clear()
+    store = FakeStore()
+    store.docs["conversations/conv-1"] = {
+        "id": "conv-1", "title": "Trip", "user_id": "user-1", "is_guest": False,
+        "created_at": NOW, "updated_at": NOW, "message_count": 0, "messages": [],
+    }
+    store.docs["users/user-1"] = {"uid": "user-1", "email": "user@example.com", "display_name": "Old Name"}
+    yield store
+    firestore_service._conversation_cache.clear()
+    firestore_service._user_profile_cache.clear()
+
+
+@pytest.fixture
+def service(store):
+    service = FirestoreService.__new__(FirestoreService)
+    service.db = store
+    return service
+
+
+@pytest.fixture
+def firebase(store):
+    # bypass the singleton so no Admin SDK app is needed
+    firebase = object.__new__(FirebaseService)
+    firebase._db = SyncFakeDb(store)
+    return firebase
+
+
+@pytest.mark.asyncio
+async def test_conversation_reads_are_memoized(service, store):
+    first = await service.get_conversation("conv-1")
+    second = await service.get_conversation("conv-1")
+
+    assert first is second
+    assert store.reads == 1
+
+
+@pytest.mark.asyncio
+async def test_conversation_update_evicts_the_cached_copy(service):
+    await service.get_conversation("conv-1")
+
+    assert await service.update_conversation("conv-1", {"title": "Renamed"})
+
+    assert (await service.get_conversation("conv-1")).title == "Renamed"
+
+
+@pytest.mark.asyncio
+async def test_add_message_evicts_the_cached_conversation(service, store):
+    await service.get_conversation("conv-1")
+    message = ChatMessage(id="m-1", role="user", content="hi", timestamp=NOW, conversation_id="conv-1")
+
+    await service.add_message(message)
+
+    assert "conv-1" not in firestore_service._conversation_cache
+    assert store.docs["conversations/conv-1/messages/m-1"]["content"] == "hi"
+
+
+@pytest.mark.asyncio
+async def test_profile_update_through_firestore_service_evicts_the_cached_profile(service):
+    await service.get_user_profile("user-1")
+
+    assert await service.update_user_profile("user-1", {"display_name": "New Name"})
+
+    assert (await service.get_user_profile("user-1")).display_name == "New Name"
+
+
+@pytest.mark.asyncio
+async def test_profile_update_through_firebase_service_evicts_the_cached_profile(service, firebase):
+    await service.get_user_profile("user-1")
+
+    assert await firebase.update_user_profile("user-1", {"display_name": "New Name"})
+
+    assert (await service.get_user_profile("user-1")).display_name == "New Name"
+
+
+@pytest.mark.asyncio
+async def test_profile_create_through_firebase_service_evicts_the_cached_profile(service, firebase):
+    await service.get_user_profile("user-1")
+
+    await firebase.create_user_profile("user-1", {"email": "user@example.com", "display_name": "Created"})
+
+    assert (await service.get_user_profile("user-1")).display_name == "Created"
@@ -0,0 +1,87 @@
+from datetime import date, datetime
+
+import orjson
+
+from app.services.flight_service import _parse_duration, _parse_raw
+
+
+def _segment(origin, destination, departure, arrival, number, duration):
+    return {
+        "departure": {"iataCode": origin, "at": departure},
+        "arrival": {"iataCode": destination, "at": arrival},
+        "carrierCode": "UA",
+        "number": number,
+        "duration": duration,
+        "numberOfStops": 0,
+    }
+
+
+FLIGHT_OFFERS_BODY = orjson.dumps({
+    "meta": {"count": 1},
+    "data": [
+        {
+            "type": "flight-offer",
+            "id": "1",
+            "lastTicketingDate": "2025-07-01",
+            "numberOfBookableSeats": 4,
+            "itineraries": [
+                {
+                    "duration": "PT7H5M",
+                    "segments": [
+                        _segment("SFO", "ORD", "2025-07-10T08:00:00", "2025-07-10T14:10:00", "1234", "PT4H10M"),
+                        _segment("ORD", "CVG", "2025-07-10T15:00:00", "2025-07-10T17:05:00", "567", "PT1H5M"),
+                    ],
+                }
+            ],
+            "price": {"currency": "USD", "total": "410.20", "grandTotal": "410.20"},
+            "validatingAirlineCodes": ["UA"],
+        }
+    ],
+})
+
+
+def test_parse_duration():
+    assert _parse_duration("PT13H56M") == "13h 56m"
+    assert _parse_duration("PT2H") == "2h"
+    assert _parse_duration("PT45M") == "45m"
+    assert _parse_duration("not-a-duration") == "not-a-duration"
+
+
+def test_parse_raw_reshapes_amadeus_offers():
+    offers = _parse_raw(FLIGHT_OFFERS_BODY)
+
+    assert len(offers) == 1
+    offer = offers[0]
+    assert offer.id == "1"
+    assert offer.price_total == 410.2
+    assert offer.currency == "USD"
+    assert offer.number_of_bookable_seats == 4
+    assert offer.last_ticketing_date == date(2025, 7, 1)
+    assert offer.validating_airline_codes == ["UA"]
+
+    itinerary = offer.itineraries[0]
+    assert itinerary.duration == "7h 5m"
+    assert [(s.departure_airport_code, s.arrival_airport_code) for s in itinerary.segments] == [
+        ("SFO", "ORD"),
+        ("ORD", "CVG"),
+    ]
+    first = itinerary.segments[0]
+    assert first.departure_time == datetime(2025, 7, 10, 8, 0)
+    assert first.flight_number == "1234"
+    assert first.duration == "4h 10m"
+
+
+def test_parse_raw_defaults_optional_fields():
+    data = orjson.loads(FLIGHT_OFFERS_BODY)
+    del data["data"][0]["numberOfBookableSeats"]
+    del data["data"][0]["validatingAirlineCodes"]
+
+    offer = _parse_raw(orjson.dumps(data))[0]
+
+    assert offer.number_of_bookable_seats == 0
+    assert offer.validating_airline_codes == []
+
+
+def test_parse_raw_without_offers():
+    assert _parse_raw(b'{"meta": {"count": 0}, "data": []}') == []
+    assert _parse_raw(b'{"errors": []}') == []
@@ -0,0 +1,98 @@
+from datetime import date
+
+from app.services.hotel_service import _HotelOffersPayload, _HotelsByCityPayload
+
+HOTELS_BY_CITY_BODY = b"""{
+    "data": [
+        {
+            "hotelId": "MCLONGHM",
+            "name": "JW Marriott Grosvenor House London",
+            "chainCode": "MC",
+            "iataCode": "LON",
+            "geoCode": {"latitude": 51.50988, "longitude": -0.15509},
+            "address": {"countryCode": "GB"},
+            "distance": {"value": 1.2, "unit": "KM"},
+            "lastUpdate": "2023-06-15T10:09:15"
+        },
+        {"hotelId": "HILON123", "name": "Minimal Hotel"}
+    ],
+    "meta": {"count": 2}
+}"""
+
+HOTEL_OFFERS_BODY = b"""{
+    "data": [
+        {
+            "type": "hotel-offers",
+            "hotel": {
+                "hotelId": "MCLONGHM",
+                "name": "JW Marriott Grosvenor House London",
+                "chainCode": "MC",
+                "cityCode": "LON",
+                "latitude": 51.50988,
+                "longitude": -0.15509
+            },
+            "available": true,
+            "offers": [
+                {
+                    "id": "TSXOJ6LFQ2",
+                    "checkInDate": "2025-07-01",
+                    "checkOutDate": "2025-07-03",
+                    "room": {
+                        "type": "AP7",
+                        "typeEstimated": {"category": "SUPERIOR_ROOM", "beds": 1, "bedType": "KING"},
+                        "description": {"text": "Superior king room", "lang": "EN"}
+                    },
+                    "guests": {"adults": 2},
+                    "price": {"currency": "GBP", "base": "650.00", "total": "715.00"},
+                    "policies": {
+                        "paymentType": "deposit",
+                        "cancellation": {"type": "FULL_STAY", "description": {"text": "Non-refundable"}}
+                    }
+                }
+            ]
+        }
+    ]
+}"""
+
+
+def test_hotels_by_city_payload_maps_camel_case_fields():
+    hotels = _HotelsByCityPayload.model_validate_json(HOTELS_BY_CITY_BODY).data
+
+    assert [hotel.hotel_id for hotel in hotels] == ["MCLONGHM", "HILON123"]
+    hotel = hotels[0]
+    assert hotel.chain_code == "MC"
+    assert hotel.iata_code == "LON"
+    assert hotel.country_code == "GB"
+    assert hotel.geo_code.latitude == 51.50988
+    assert hotel.distance.unit == "KM"
+    assert hotels[1].country_code is None
+
+
+def test_hotels_by_city_payload_defaults_to_empty_list():
+    assert _HotelsByCityPayload.model_validate_json(b'{"meta": {"count": 0}}').data == []
+
+
+def test_hotel_offers_payload_flattens_nested_fields():
+    responses = _HotelOffersPayload.model_validate_json(HOTEL_OFFERS_BODY).data
+
+    assert len(responses) == 1
+    assert responses[0].hotel.hotel_id == "MCLONGHM"
+    assert responses[0].hotel.city_code == "LON"
+
+    offer = responses[0].offers[0]
+    assert offer.offer_id == "TSXOJ6LFQ2"
+    assert offer.check_in_date == date(2025, 7, 1)
+    assert offer.price.total == 715.0
+    assert offer.room.type_estimated.bed_type == "KING"
+    assert offer.payment_type == "deposit"
+    assert offer.cancellation_policy.type == "FULL_STAY"
+    assert offer.cancellation_policy.description_text == "Non-refundable"
+
+
+def test_hotel_offers_serialize_with_snake_case_names():
+    offer = _HotelOffersPayload.model_validate_json(HOTEL_OFFERS_BODY).data[0].offers[0]
+    dumped = offer.model_dump()
+
+    assert dumped["offer_id"] == "TSXOJ6LFQ2"
+    assert "id" not in dumped
+    assert dumped["room"]["type_estimated"]["bed_type"] == "KING"
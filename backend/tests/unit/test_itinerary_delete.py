@@ -0,0 +1,103 @@
+import pytest
+
+from app.services import firestore_service
+from app.services.firestore_service import FirestoreService
+
+ITINERARIES = [
+    {"id": "itin-1", "title": "Paris"},
+    {"id": "itin-2", "title": "Rome"},
+]
+
+
+class FakeSnapshot:
+    def __init__(self, data):
+        self._data = data
+        self.exists = data is not None
+
+    def to_dict(self):
+        return self._data
+
+
+class FakeTransaction:
+    def __init__(self):
+        self.updates = []
+
+    def update(self, ref, data):
+        self.updates.append((ref, data))
+
+
+class FakeUserDocument:
+    def __init__(self, data):
+        self.data = data
+        self.read_in_transaction = None
+
+    async def get(self, transaction=None):
+        self.read_in_transaction = transaction
+        return FakeSnapshot(self.data)
+
+
+class FakeClient:
+    def __init__(self, data):
+        self.user_doc = FakeUserDocument(data)
+        self.current_transaction = FakeTransaction()
+
+    def collection(self, name):
+        assert name == "users"
+        return self
+
+    def document(self, user_id):
+        return self.user_doc
+
+    def transaction(self):
+        return self.current_transaction
+
+
+@pytest.fixture(autouse=True)
+def run_transaction_once(monkeypatch):
+    # the real decorator begins/commits/retries against Firestore; call the function directly
+    monkeypatch.setattr(firestore_service.firestore, "async_transactional", lambda func: func)
+    firestore_service._user_profile_cache.clear()
+    yield
+    firestore_service._user_profile_cache.clear()
+
+
+def _service(data):
+    service = FirestoreService.__new__(FirestoreService)
+    service.db = FakeClient(data)
+    return service
+
+
+@pytest.mark.asyncio
+async def test_itinerary_is_removed_inside_the_transaction():
+    service = _service({"uid": "user-1", "saved_itineraries": ITINERARIES})
+    firestore_service._user_profile_cache["user-1"] = object()
+
+    assert await service.delete_user_itinerary("user-1", "itin-1")
+
+    transaction = service.db.current_transaction
+    assert service.db.user_doc.read_in_transaction is transaction
+    [(ref, update)] = transaction.updates
+    assert ref is service.db.user_doc
+    # ArrayRemove needs the stored entry exactly as read
+    assert update["saved_itineraries"].values == [{"id": "itin-1", "title": "Paris"}]
+    assert "user-1" not in firestore_service._user_profile_cache
+
+
+@pytest.mark.asyncio
+async def test_unknown_itinerary_writes_nothing():
+    service = _service({"uid": "user-1", "saved_itineraries": ITINERARIES})
+
+    assert await service.delete_user_itinerary("user-1", "itin-9")
+
+    assert not service.db.current_transaction.updates
+
+
+@pytest.mark.asyncio
+async def test_missing_user_reports_failure():
+    service = _service(None)
+    firestore_service._user_profile_cache["user-1"] = cached = object()
+
+    assert not await service.delete_user_itinerary("user-1", "itin-1")
+
+    assert not service.db.current_transaction.updates
+    assert firestore_service._user_profile_cache["user-1"] is cached
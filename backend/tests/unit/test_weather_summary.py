@@ -0,0 +1,49 @@
+import dataclasses
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.weather_schemas import RawWeatherValues, WeatherSignals
+from app.services.weather_service import WeatherService, _weather_signals_adapter
+
+
+def test_summary_labels_are_validated_dataclasses():
+    summary = WeatherService.generate_weather_summary({
+        "temperatureAvg": 18.5,
+        "precipitationSum": 0,
+        "windSpeedAvg": 12,
+        "uvIndexAvg": 6.2,
+        "humidityAvg": 71,
+        "cloudCoverAvg": 35,
+    })
+
+    assert summary["signals"] == WeatherSignals(
+        temp_avg="warm", rain_chance="none", wind_speed="breezy",
+        uv_index="high", humidity="humid", cloud_cover="partly_cloudy",
+    )
+    assert summary["raw"] == RawWeatherValues(
+        temp_avg_c=18.5, rain_mm=0, wind_kph=12, uv_index=6.2, humidity=71, cloud_cover=35,
+    )
+
+
+def test_missing_metrics_are_labelled_unavailable():
+    summary = WeatherService.generate_weather_summary({"temperatureAvg": 2})
+
+    assert summary["signals"].temp_avg == "cold"
+    assert summary["signals"].uv_index == "unavailable"
+    assert summary["raw"].wind_kph is None
+
+
+def test_unknown_label_is_rejected():
+    with pytest.raises(ValidationError):
+        _weather_signals_adapter.validate_python({
+            "temp_avg": "bogus", "rain_chance": "none", "wind_speed": "calm",
+            "uv_index": "low", "humidity": "dry", "cloud_cover": "clear",
+        })
+
+
+def test_weather_dataclasses_are_frozen():
+    raw = RawWeatherValues(temp_avg_c=10.0)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        raw.temp_avg_c = 30.0